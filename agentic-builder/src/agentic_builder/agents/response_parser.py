@@ -3,8 +3,18 @@
 import re
 from dataclasses import dataclass, field
 
+try:
+    from lxml import etree
 
-@dataclass
+    # Never resolve entities or fetch anything while parsing agent output
+    _XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+except ImportError:
+    import xml.etree.ElementTree as etree
+
+    _XML_PARSER = None
+
+
+@dataclass(slots=True)
 class AgentResponse:
     """Parsed agent response."""
 
@@ -17,6 +27,71 @@ class AgentResponse:
     raw_xml: str = ""
 
 
+_NO_TASK_OUTPUT_SUMMARY = "Failed to parse response - no task_output found"
+
+_ARTIFACT_RE = re.compile(
+    r'<artifact\s+type="([^"]+)"\s+name="([^"]+)"[^>]*>(.*?)</artifact>', re.DOTALL
+)
+_TASK_RE = re.compile(
+    r'<task\s+agent="([^"]+)"\s+priority="([^"]+)"[^>]*>(.*?)</task>', re.DOTALL
+)
+# Name and double- or single-quoted value of each attribute in an opening tag
+_ATTRIBUTE_RE = re.compile(r"""([^\s=]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+# Markup that may sit between elements: (opener, closer)
+_SKIPPED_MARKUP = (("<!--", "-->"), ("<![CDATA[", "]]>"), ("<?", "?>"))
+
+# (tag, element start, content start, content end, element end)
+_Child = tuple[str, int, int, int, int]
+
+
+def _find_element(xml: str, tag: str, start: int = 0) -> tuple[int, int, int, int] | None:
+    """Locate the next element with the given tag.
+
+    Args:
+        xml: XML string to search
+        tag: Tag name to find
+        start: Index to start searching from
+
+    Returns:
+        Tuple of (element start, content start, content end, element end),
+        or None if no complete element is found
+    """
+    opening = f"<{tag}"
+    pos = xml.find(opening, start)
+    while pos != -1:
+        after = pos + len(opening)
+        # Skip longer tag names that merely start with this one
+        if after < len(xml) and (xml[after] == ">" or xml[after].isspace()):
+            break
+        pos = xml.find(opening, after)
+    else:
+        return None
+
+    content_start = xml.find(">", after) + 1
+    if not content_start:
+        return None
+    closing = f"</{tag}>"
+    content_end = xml.find(closing, content_start)
+    if content_end == -1:
+        return None
+    return pos, content_start, content_end, content_end + len(closing)
+
+
+def _strip_content(content: str) -> str:
+    """Strip whitespace and an enclosing CDATA section from tag content.
+
+    Args:
+        content: Raw tag content
+
+    Returns:
+        Cleaned content
+    """
+    content = content.strip()
+    if content.startswith("<![CDATA[") and content.endswith("]]>"):
+        content = content[9:-3]  # Remove <![CDATA[ and ]]>
+    return content
+
+
 def extract_tag_content(xml: str, tag: str) -> str | None:
     """Extract content from an XML tag.
 
@@ -27,15 +102,11 @@ def extract_tag_content(xml: str, tag: str) -> str | None:
     Returns:
         Tag content or None if not found
     """
-    pattern = rf"<{tag}[^>]*>(.*?)</{tag}>"
-    match = re.search(pattern, xml, re.DOTALL)
-    if match:
-        content = match.group(1).strip()
-        # Handle CDATA sections
-        if content.startswith("<![CDATA[") and content.endswith("]]>"):
-            content = content[9:-3]  # Remove <![CDATA[ and ]]>
-        return content
-    return None
+    found = _find_element(xml, tag)
+    if found is None:
+        return None
+    _, content_start, content_end, _ = found
+    return _strip_content(xml[content_start:content_end])
 
 
 def extract_list_items(xml: str, container_tag: str, item_tag: str) -> list[str]:
@@ -52,51 +123,228 @@ def extract_list_items(xml: str, container_tag: str, item_tag: str) -> list[str]
     container = extract_tag_content(xml, container_tag)
     if not container:
         return []
-    pattern = rf"<{item_tag}[^>]*>(.*?)</{item_tag}>"
-    matches = re.findall(pattern, container, re.DOTALL)
-    return [m.strip() for m in matches]
+    items = []
+    found = _find_element(container, item_tag)
+    while found is not None:
+        _, content_start, content_end, end = found
+        items.append(container[content_start:content_end].strip())
+        found = _find_element(container, item_tag, end)
+    return items
 
 
-def parse_response(xml: str) -> AgentResponse:
-    """Parse agent XML response into structured data.
+def _child_elements(xml: str, start: int, end: int) -> list[_Child]:
+    """Locate the direct child elements within well-formed xml[start:end].
+
+    Comments, CDATA sections and processing instructions are skipped, as is
+    anything nested inside a child.
 
     Args:
-        xml: Raw XML response from agent
+        xml: Well-formed XML string
+        start: Start of the parent's content
+        end: End of the parent's content
 
     Returns:
-        Parsed AgentResponse object
+        List of child elements in document order
     """
-    # Find task_output block
-    output_xml = extract_tag_content(xml, "task_output")
-    if not output_xml:
-        # Try to find it in the raw response
-        if "<task_output>" in xml:
-            start = xml.index("<task_output>")
-            end = xml.index("</task_output>") + len("</task_output>")
-            output_xml = xml[start:end]
+    children = []
+    pos = xml.find("<", start, end)
+    while pos != -1:
+        for opener, closer in _SKIPPED_MARKUP:
+            if xml.startswith(opener, pos):
+                pos = xml.find(closer, pos, end) + len(closer)
+                break
         else:
-            return AgentResponse(
-                success=False,
-                summary="Failed to parse response - no task_output found",
-                raw_xml=xml,
-            )
+            tag_end = xml.find(">", pos, end)
+            if xml[tag_end - 1] == "/":
+                # A self-closing element has no content
+                tag = xml[pos + 1 : tag_end - 1].split(None, 1)[0]
+                children.append((tag, pos, tag_end + 1, tag_end + 1, tag_end + 1))
+                pos = tag_end + 1
+            else:
+                tag = xml[pos + 1 : tag_end].split(None, 1)[0]
+                content_end = xml.find(f"</{tag}>", tag_end + 1, end)
+                element_end = content_end + len(tag) + 3
+                children.append((tag, pos, tag_end + 1, content_end, element_end))
+                pos = element_end
+        pos = xml.find("<", pos, end)
+    return children
+
+
+def _child_content(xml: str, children: list[_Child], tag: str) -> str:
+    """Get the verbatim content of the first child with the given tag.
+
+    Args:
+        xml: XML string the children were located in
+        children: Child elements from _child_elements
+        tag: Tag name to extract
+
+    Returns:
+        Stripped child content, or an empty string
+    """
+    for child_tag, _, content_start, content_end, _ in children:
+        if child_tag == tag:
+            return _strip_content(xml[content_start:content_end])
+    return ""
+
+
+def _child_items(
+    xml: str, children: list[_Child], container_tag: str, item_tag: str
+) -> list[str]:
+    """Get the verbatim content of each item in the first child container.
+
+    Args:
+        xml: XML string the children were located in
+        children: Child elements from _child_elements
+        container_tag: Container element tag
+        item_tag: Item element tag
+
+    Returns:
+        List of item contents
+    """
+    for child_tag, _, content_start, content_end, _ in children:
+        if child_tag == container_tag:
+            return [
+                _strip_content(xml[item_start:item_end])
+                for tag, _, item_start, item_end, _ in _child_elements(
+                    xml, content_start, content_end
+                )
+                if tag == item_tag
+            ]
+    return []
+
+
+def _child_attributed(
+    xml: str, children: list[_Child], container_tag: str, item_tag: str
+) -> list[tuple[dict[str, str], list[_Child]]]:
+    """Get the attributes and children of each item in the first child container.
+
+    Args:
+        xml: XML string the children were located in
+        children: Child elements from _child_elements
+        container_tag: Container element tag
+        item_tag: Item element tag
+
+    Returns:
+        List of (attributes, item children) tuples
+    """
+    for child_tag, _, content_start, content_end, _ in children:
+        if child_tag == container_tag:
+            return [
+                (
+                    {
+                        name: double or single
+                        for name, double, single in _ATTRIBUTE_RE.findall(
+                            xml, item_start, item_content_start
+                        )
+                    },
+                    _child_elements(xml, item_content_start, item_content_end),
+                )
+                for tag, item_start, item_content_start, item_content_end, _ in (
+                    _child_elements(xml, content_start, content_end)
+                )
+                if tag == item_tag
+            ]
+    return []
 
-    # Extract fields
+
+def _parse_element_tree(output_xml: str, raw_xml: str) -> AgentResponse | None:
+    """Parse a well-formed task_output block.
+
+    The XML parser only checks that the block is well-formed. Fields are
+    then sliced from output_xml, so artifact content comes back exactly as
+    the agent wrote it.
+
+    Args:
+        output_xml: Complete <task_output> element
+        raw_xml: Raw XML response from agent
+
+    Returns:
+        Parsed AgentResponse, or None if the block is not well-formed XML
+    """
+    try:
+        etree.fromstring(output_xml, _XML_PARSER)
+    except etree.ParseError:
+        return None
+    root = _child_elements(output_xml, 0, len(output_xml))[0]
+    fields = _child_elements(output_xml, root[2], root[3])
+
+    artifacts = []
+    for attrs, children in _child_attributed(output_xml, fields, "artifacts", "artifact"):
+        art_type, art_name = attrs.get("type"), attrs.get("name")
+        if not (art_type and art_name):
+            continue
+        artifacts.append(
+            {
+                "type": art_type,
+                "name": art_name,
+                "description": _child_content(output_xml, children, "description"),
+                "content": _child_content(output_xml, children, "content"),
+            }
+        )
+
+    next_tasks = []
+    for attrs, children in _child_attributed(output_xml, fields, "next_tasks", "task"):
+        agent, priority = attrs.get("agent"), attrs.get("priority")
+        if not (agent and priority):
+            continue
+        next_tasks.append(
+            {
+                "agent_type": agent,
+                "priority": priority,
+                "title": _child_content(output_xml, children, "title"),
+                "description": _child_content(output_xml, children, "description"),
+                "acceptance_criteria": _child_items(
+                    output_xml, children, "acceptance_criteria", "criterion"
+                ),
+            }
+        )
+
+    return AgentResponse(
+        success=_child_content(output_xml, fields, "success").lower() == "true",
+        summary=_child_content(output_xml, fields, "summary"),
+        key_decisions=_child_items(output_xml, fields, "key_decisions", "decision"),
+        artifacts=artifacts,
+        next_tasks=next_tasks,
+        warnings=_child_items(output_xml, fields, "warnings", "warning"),
+        raw_xml=raw_xml,
+    )
+
+
+def _parse_tag_matching(output_xml: str, raw_xml: str) -> AgentResponse:
+    """Parse the content of a task_output block that is not well-formed XML.
+
+    Args:
+        output_xml: Content of the <task_output> element
+        raw_xml: Raw XML response from agent
+
+    Returns:
+        Parsed AgentResponse object
+    """
     success_str = extract_tag_content(output_xml, "success")
-    success = success_str.lower() == "true" if success_str else False
+    return AgentResponse(
+        success=success_str.lower() == "true" if success_str else False,
+        summary=extract_tag_content(output_xml, "summary") or "",
+        raw_xml=raw_xml,
+        **_tag_matching_lists(output_xml),
+    )
+
 
-    summary = extract_tag_content(output_xml, "summary") or ""
+def _tag_matching_lists(output_xml: str) -> dict[str, list]:
+    """Build the list fields of a response by tag matching.
+
+    Args:
+        output_xml: Content of the <task_output> element
+
+    Returns:
+        Dictionary of list field name to items
+    """
     key_decisions = extract_list_items(output_xml, "key_decisions", "decision")
     warnings = extract_list_items(output_xml, "warnings", "warning")
-
     # Parse artifacts
     artifacts = []
     artifacts_xml = extract_tag_content(output_xml, "artifacts")
     if artifacts_xml:
-        artifact_pattern = (
-            r'<artifact\s+type="([^"]+)"\s+name="([^"]+)"[^>]*>(.*?)</artifact>'
-        )
-        for match in re.finditer(artifact_pattern, artifacts_xml, re.DOTALL):
+        for match in _ARTIFACT_RE.finditer(artifacts_xml):
             art_type, art_name, art_content = match.groups()
             description = extract_tag_content(art_content, "description") or ""
             content = extract_tag_content(art_content, "content") or ""
@@ -113,8 +361,7 @@ def parse_response(xml: str) -> AgentResponse:
     next_tasks = []
     tasks_xml = extract_tag_content(output_xml, "next_tasks")
     if tasks_xml:
-        task_pattern = r'<task\s+agent="([^"]+)"\s+priority="([^"]+)"[^>]*>(.*?)</task>'
-        for match in re.finditer(task_pattern, tasks_xml, re.DOTALL):
+        for match in _TASK_RE.finditer(tasks_xml):
             agent, priority, task_content = match.groups()
             title = extract_tag_content(task_content, "title") or ""
             description = extract_tag_content(task_content, "description") or ""
@@ -131,12 +378,38 @@ def parse_response(xml: str) -> AgentResponse:
                 }
             )
 
-    return AgentResponse(
-        success=success,
-        summary=summary,
-        key_decisions=key_decisions,
-        artifacts=artifacts,
-        next_tasks=next_tasks,
-        warnings=warnings,
-        raw_xml=xml,
-    )
+    return {
+        "key_decisions": key_decisions,
+        "artifacts": artifacts,
+        "next_tasks": next_tasks,
+        "warnings": warnings,
+    }
+
+
+def parse_response(xml: str) -> AgentResponse:
+    """Parse agent XML response into structured data.
+
+    Well-formedness is checked with lxml when installed, else ElementTree.
+    Output that is not valid XML (e.g. code with unescaped ``<`` or ``&``)
+    falls back to tag matching.
+
+    Args:
+        xml: Raw XML response from agent
+
+    Returns:
+        Parsed AgentResponse object
+    """
+    # Find task_output block; a single str.find when there is none
+    found = _find_element(xml, "task_output")
+    if found is None:
+        return AgentResponse(
+            success=False,
+            summary=_NO_TASK_OUTPUT_SUMMARY,
+            raw_xml=xml,
+        )
+
+    start, content_start, content_end, end = found
+    response = _parse_element_tree(xml[start:end], xml)
+    if response is None:
+        response = _parse_tag_matching(xml[content_start:content_end], xml)
+    return response
@@ -50,32 +50,31 @@ def logs(
         if task.get("error_message"):
             console.print(f"[bold red]Error:[/bold red] {task['error_message']}")
 
+        if show_context or show_output:
+            context, output = task_storage.get_task_io(task_id)
+
         # Show context
-        if show_context:
-            context = task_storage.get_task_context(task_id)
-            if context:
-                console.print("\n[bold]Context XML:[/bold]")
-                syntax = Syntax(context, "xml", theme="monokai", line_numbers=True)
-                console.print(Panel(syntax, title="Task Context"))
+        if show_context and context:
+            console.print("\n[bold]Context XML:[/bold]")
+            syntax = Syntax(context, "xml", theme="monokai", line_numbers=True)
+            console.print(Panel(syntax, title="Task Context"))
 
         # Show output
-        if show_output:
-            output = task_storage.get_task_output(task_id)
-            if output:
-                console.print("\n[bold]Output:[/bold]")
-                console.print(f"Summary: {output.get('summary', 'N/A')}")
-
-                if output.get("key_decisions"):
-                    console.print("\n[bold]Key Decisions:[/bold]")
-                    for decision in output["key_decisions"]:
-                        console.print(f"  • {decision}")
-
-                if output.get("output_xml"):
-                    console.print("\n[bold]Output XML:[/bold]")
-                    syntax = Syntax(
-                        output["output_xml"], "xml", theme="monokai", line_numbers=True
-                    )
-                    console.print(Panel(syntax, title="Task Output"))
+        if show_output and output:
+            console.print("\n[bold]Output:[/bold]")
+            console.print(f"Summary: {output.get('summary', 'N/A')}")
+
+            if output.get("key_decisions"):
+                console.print("\n[bold]Key Decisions:[/bold]")
+                for decision in output["key_decisions"]:
+                    console.print(f"  • {decision}")
+
+            if output.get("output_xml"):
+                console.print("\n[bold]Output XML:[/bold]")
+                syntax = Syntax(
+                    output["output_xml"], "xml", theme="monokai", line_numbers=True
+                )
+                console.print(Panel(syntax, title="Task Output"))
         return
 
     # Get workflow tasks
@@ -47,10 +47,9 @@ def tasks(
     console.print(f"[bold]Status:[/bold] {format_status(workflow['status'])}\n")
 
     # Get tasks
-    all_tasks = task_storage.get_workflow_tasks(workflow["id"])
-
-    if status_filter:
-        all_tasks = [t for t in all_tasks if t["status"] == status_filter.lower()]
+    all_tasks = task_storage.get_workflow_tasks(
+        workflow["id"], status=status_filter.lower() if status_filter else None
+    )
 
     if agent_filter:
         all_tasks = [
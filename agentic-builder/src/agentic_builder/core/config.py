@@ -26,7 +26,7 @@ class Config(BaseModel):
 
 def get_project_dir() -> Path:
     """Get the .agentic directory for current project."""
-    return Path.cwd() / ".agentic"
+    return Path(os.getcwd()) / ".agentic"
 
 
 def get_db_path() -> Path:
@@ -67,15 +67,13 @@ class WorkflowEngine:
         workflow_id = workflow_storage.create_workflow(workflow_type, description)
 
         # Create stages
-        stage_ids = []
-        for i, stage_def in enumerate(workflow_def.stages):
-            stage_id = workflow_storage.create_stage(
-                workflow_run_id=workflow_id,
-                stage_name=stage_def.name,
-                stage_order=i,
-                parallel=stage_def.parallel,
-            )
-            stage_ids.append(stage_id)
+        stage_ids = workflow_storage.create_stages_bulk(
+            workflow_id,
+            [
+                (stage_def.name, i, stage_def.parallel)
+                for i, stage_def in enumerate(workflow_def.stages)
+            ],
+        )
 
         # Create initial task for first agent
         first_stage = workflow_def.stages[0]
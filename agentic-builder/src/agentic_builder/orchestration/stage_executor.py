@@ -6,6 +6,7 @@ from agentic_builder.agents.executor import execute_agent
 from agentic_builder.context.serializer import build_task_context
 from agentic_builder.core.constants import AgentType, TaskStatus
 from agentic_builder.storage import tasks as task_storage
+from agentic_builder.storage.tasks import TaskRow
 
 
 async def execute_stage(
@@ -51,11 +52,11 @@ async def execute_stage(
         return True
 
 
-async def execute_task(task: dict) -> bool:
+async def execute_task(task: TaskRow) -> bool:
     """Execute a single task.
 
     Args:
-        task: Task dictionary from storage
+        task: Task row from storage
 
     Returns:
         True if task completed successfully
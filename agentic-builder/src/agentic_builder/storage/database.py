@@ -3,28 +3,41 @@
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterable
 
 from agentic_builder.core.config import get_db_path
 from agentic_builder.storage.schema import SCHEMA_DDL
 
+# Milliseconds a connection waits on a locked database before failing
+BUSY_TIMEOUT_MS = 5000
+
+# UPDATE ... RETURNING needs SQLite 3.35 or newer
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
 
 class Database:
     """SQLite database manager."""
 
-    def __init__(self, db_path: Path | None = None):
+    def __init__(self, db_path: Path | str | None = None):
         """Initialize database manager.
 
         Args:
-            db_path: Path to SQLite database file. Defaults to .agentic/agentic.db
+            db_path: Path to SQLite database file, or a ``file:`` URI such as a
+                shared in-memory database. Defaults to .agentic/agentic.db
         """
         self.db_path = db_path or get_db_path()
         self._connection: sqlite3.Connection | None = None
 
     def initialize(self) -> None:
-        """Initialize database with schema."""
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        """Initialize database with schema.
+
+        Switches the database to WAL journaling, which persists in the file,
+        so later connections commit without a full fsync per transaction.
+        """
+        if isinstance(self.db_path, Path):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
         with self.connection() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.executescript(SCHEMA_DDL)
 
     @contextmanager
@@ -34,9 +47,11 @@ class Database:
         Yields:
             sqlite3.Connection with row factory set to sqlite3.Row
         """
-        conn = sqlite3.connect(self.db_path)
+        # The timeout sets SQLite's busy handler without a PRAGMA round trip
+        conn = sqlite3.connect(self.db_path, uri=True, timeout=BUSY_TIMEOUT_MS / 1000)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
         try:
             yield conn
             conn.commit()
@@ -74,6 +89,37 @@ class Database:
             cursor = conn.execute(query, params)
             return cursor.fetchone()
 
+    def execute_returning(
+        self,
+        query: str,
+        params: tuple,
+        columns: str,
+        select: str,
+        select_params: tuple,
+    ) -> sqlite3.Row | None:
+        """Execute a single-row write query and return the written row.
+
+        Uses a RETURNING clause where SQLite supports it. Older libraries
+        run the write and then the select in the same transaction.
+
+        Args:
+            query: SQL write query without a RETURNING clause
+            params: Write query parameters
+            columns: Column list to return
+            select: Query reading back the same columns of the written row
+            select_params: Select query parameters
+
+        Returns:
+            The written sqlite3.Row, or None if no row matched
+        """
+        with self.connection() as conn:
+            if SUPPORTS_RETURNING:
+                rows = conn.execute(f"{query} RETURNING {columns}", params).fetchall()
+                return rows[0] if rows else None
+            if not conn.execute(query, params).rowcount:
+                return None
+            return conn.execute(select, select_params).fetchone()
+
     def execute_write(self, query: str, params: tuple = ()) -> int:
         """Execute a write query and return rows affected.
 
@@ -88,6 +134,20 @@ class Database:
             cursor = conn.execute(query, params)
             return cursor.rowcount
 
+    def execute_many(self, query: str, params_seq: Iterable[tuple]) -> int:
+        """Execute a write query for each parameter set in one transaction.
+
+        Args:
+            query: SQL query string
+            params_seq: Iterable of query parameter tuples
+
+        Returns:
+            Total number of rows affected
+        """
+        with self.connection() as conn:
+            cursor = conn.executemany(query, params_seq)
+            return cursor.rowcount
+
 
 # Global database instance (lazy init)
 _db: Database | None = None
@@ -0,0 +1,23 @@
+"""Shared behaviour for storage row records."""
+
+
+class RowMixin:
+    """Dict-style column access for slotted row dataclasses.
+
+    Supports ``row["column"]`` and ``row.get("column")`` like a dict. Only
+    dataclass fields count as columns, so methods and other attributes are
+    never returned as values.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        """Get a column value, or default if there is no such column."""
+        if key not in self.__dataclass_fields__:
+            return default
+        return getattr(self, key)
@@ -36,7 +36,9 @@ CREATE TABLE IF NOT EXISTS workflow_stages (
     FOREIGN KEY (workflow_run_id) REFERENCES workflow_runs(id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_workflow_stages_run ON workflow_stages(workflow_run_id);
+-- Superseded by idx_workflow_stages_run_order in existing databases
+DROP INDEX IF EXISTS idx_workflow_stages_run;
+CREATE INDEX IF NOT EXISTS idx_workflow_stages_run_order ON workflow_stages(workflow_run_id, stage_order, status);
 
 -- Tasks
 CREATE TABLE IF NOT EXISTS tasks (
@@ -60,7 +62,9 @@ CREATE TABLE IF NOT EXISTS tasks (
     FOREIGN KEY (stage_id) REFERENCES workflow_stages(id) ON DELETE SET NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_tasks_workflow ON tasks(workflow_run_id);
+-- Superseded by idx_tasks_workflow_status in existing databases
+DROP INDEX IF EXISTS idx_tasks_workflow;
+CREATE INDEX IF NOT EXISTS idx_tasks_workflow_status ON tasks(workflow_run_id, status);
 CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
 CREATE INDEX IF NOT EXISTS idx_tasks_agent ON tasks(agent_type);
 
@@ -1,10 +1,100 @@
 """Task storage operations."""
 
-import json
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 
 from agentic_builder.core.constants import TaskStatus
 from agentic_builder.storage.database import get_db
+from agentic_builder.storage.rows import RowMixin
+
+try:
+    import orjson
+
+    def _dumps(value: object) -> str:
+        return orjson.dumps(value).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _dumps = json.dumps
+    _loads = json.loads
+
+
+@dataclass(slots=True)
+class TaskRow(RowMixin):
+    """A row of the tasks table."""
+
+    id: str
+    workflow_run_id: str
+    stage_id: str | None
+    title: str
+    description: str | None
+    status: str
+    priority: str | None
+    agent_type: str
+    assigned_agent_instance_id: str | None
+    created_by: str | None
+    tokens_used: int | None
+    execution_time_ms: int | None
+    error_message: str | None
+    created_at: str | None
+    updated_at: str | None
+    completed_at: str | None
+
+    def __post_init__(self) -> None:
+        # Low-cardinality columns share one string object per distinct value
+        self.status = sys.intern(self.status)
+        self.agent_type = sys.intern(self.agent_type)
+        if self.priority is not None:
+            self.priority = sys.intern(self.priority)
+
+
+# Columns in TaskRow field order
+_TASK_COLUMNS = """
+    id, workflow_run_id, stage_id, title, description, status, priority,
+    agent_type, assigned_agent_instance_id, created_by, tokens_used,
+    execution_time_ms, error_message, created_at, updated_at, completed_at
+"""
+
+_INSERT_TASK_SQL = """
+    INSERT INTO tasks (id, workflow_run_id, stage_id, title, description,
+                      status, priority, agent_type, created_by)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_GET_TASK_SQL = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE id = ?"
+_WORKFLOW_TASKS_SQL = (
+    f"SELECT {_TASK_COLUMNS} FROM tasks WHERE workflow_run_id = ? ORDER BY created_at"
+)
+_WORKFLOW_TASKS_BY_STATUS_SQL = (
+    f"SELECT {_TASK_COLUMNS} FROM tasks"
+    " WHERE workflow_run_id = ? AND status = ? ORDER BY created_at"
+)
+_STAGE_TASKS_SQL = f"SELECT {_TASK_COLUMNS} FROM tasks WHERE stage_id = ? ORDER BY created_at"
+_STAGE_TASKS_BY_STATUS_SQL = (
+    f"SELECT {_TASK_COLUMNS} FROM tasks"
+    " WHERE stage_id = ? AND status = ? ORDER BY created_at"
+)
+_RUNNABLE_TASKS_SQL = f"""
+    SELECT {_TASK_COLUMNS} FROM tasks t
+    WHERE t.workflow_run_id = ?
+      AND t.status = 'pending'
+      AND NOT EXISTS (
+        SELECT 1 FROM task_dependencies td
+        JOIN tasks dt ON td.depends_on_task_id = dt.id
+        WHERE td.task_id = t.id AND dt.status != 'completed'
+      )
+"""
+# Both lookups hang off a one-row key so either side may be missing
+_TASK_IO_SQL = """
+    SELECT c.context_xml, o.task_id, o.output_xml, o.summary, o.key_decisions,
+           o.artifacts, o.tokens_used, o.model_used, o.created_at
+    FROM (SELECT ? AS task_id) k
+    LEFT JOIN task_context c ON c.task_id = k.task_id
+    LEFT JOIN task_outputs o ON o.task_id = k.task_id
+"""
 
 
 def create_task(
@@ -31,11 +121,7 @@ def create_task(
     """
     db = get_db()
     db.execute_write(
-        """
-        INSERT INTO tasks (id, workflow_run_id, stage_id, title, description,
-                          status, priority, agent_type, created_by)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        _INSERT_TASK_SQL,
         (
             task_id,
             workflow_run_id,
@@ -50,47 +136,83 @@ def create_task(
     )
 
 
-def get_task(task_id: str) -> dict | None:
+def create_tasks_bulk(tasks: Iterable[dict]) -> int:
+    """Create several tasks in a single transaction.
+
+    Args:
+        tasks: Task dictionaries keyed like create_task's arguments
+            (task_id, workflow_run_id, title and agent_type are required)
+
+    Returns:
+        Number of tasks created
+    """
+    db = get_db()
+    return db.execute_many(
+        _INSERT_TASK_SQL,
+        [
+            (
+                task["task_id"],
+                task["workflow_run_id"],
+                task.get("stage_id"),
+                task["title"],
+                task.get("description", ""),
+                TaskStatus.PENDING.value,
+                task.get("priority", "medium"),
+                task["agent_type"],
+                task.get("created_by"),
+            )
+            for task in tasks
+        ],
+    )
+
+
+def get_task(task_id: str) -> TaskRow | None:
     """Get task by ID.
 
     Args:
         task_id: Task identifier
 
     Returns:
-        Task dictionary or None if not found
+        TaskRow or None if not found
     """
     db = get_db()
-    row = db.execute_one("SELECT * FROM tasks WHERE id = ?", (task_id,))
-    return dict(row) if row else None
+    row = db.execute_one(_GET_TASK_SQL, (task_id,))
+    return TaskRow(*row) if row else None
 
 
 def get_workflow_tasks(
-    workflow_run_id: str, status: str | None = None
-) -> list[dict]:
+    workflow_run_id: str, status: str | Iterable[str] | None = None
+) -> list[TaskRow]:
     """Get tasks for a workflow.
 
     Args:
         workflow_run_id: Workflow identifier
-        status: Optional status filter
+        status: Optional status filter, or several statuses to match any of
 
     Returns:
-        List of task dictionaries
+        List of TaskRow objects
     """
     db = get_db()
-    if status:
-        rows = db.execute(
-            "SELECT * FROM tasks WHERE workflow_run_id = ? AND status = ? ORDER BY created_at",
-            (workflow_run_id, status),
-        )
+    if status is None or isinstance(status, str):
+        if status:
+            rows = db.execute(_WORKFLOW_TASKS_BY_STATUS_SQL, (workflow_run_id, status))
+        else:
+            rows = db.execute(_WORKFLOW_TASKS_SQL, (workflow_run_id,))
     else:
+        statuses = tuple(status)
+        if not statuses:
+            return []
+        placeholders = ", ".join("?" * len(statuses))
         rows = db.execute(
-            "SELECT * FROM tasks WHERE workflow_run_id = ? ORDER BY created_at",
-            (workflow_run_id,),
+            f"SELECT {_TASK_COLUMNS} FROM tasks"
+            f" WHERE workflow_run_id = ? AND status IN ({placeholders})"
+            " ORDER BY created_at",
+            (workflow_run_id, *statuses),
         )
-    return [dict(row) for row in rows]
+    return [TaskRow(*row) for row in rows]
 
 
-def get_stage_tasks(stage_id: str, status: str | None = None) -> list[dict]:
+def get_stage_tasks(stage_id: str, status: str | None = None) -> list[TaskRow]:
     """Get tasks for a stage.
 
     Args:
@@ -98,20 +220,14 @@ def get_stage_tasks(stage_id: str, status: str | None = None) -> list[dict]:
         status: Optional status filter
 
     Returns:
-        List of task dictionaries
+        List of TaskRow objects
     """
     db = get_db()
     if status:
-        rows = db.execute(
-            "SELECT * FROM tasks WHERE stage_id = ? AND status = ? ORDER BY created_at",
-            (stage_id, status),
-        )
+        rows = db.execute(_STAGE_TASKS_BY_STATUS_SQL, (stage_id, status))
     else:
-        rows = db.execute(
-            "SELECT * FROM tasks WHERE stage_id = ? ORDER BY created_at",
-            (stage_id,),
-        )
-    return [dict(row) for row in rows]
+        rows = db.execute(_STAGE_TASKS_SQL, (stage_id,))
+    return [TaskRow(*row) for row in rows]
 
 
 def update_task_status(
@@ -174,30 +290,18 @@ def get_task_dependencies(task_id: str) -> list[str]:
     return [row["depends_on_task_id"] for row in rows]
 
 
-def get_runnable_tasks(workflow_run_id: str) -> list[dict]:
+def get_runnable_tasks(workflow_run_id: str) -> list[TaskRow]:
     """Get tasks that are ready to run (all dependencies completed).
 
     Args:
         workflow_run_id: Workflow identifier
 
     Returns:
-        List of runnable task dictionaries
+        List of runnable TaskRow objects
     """
     db = get_db()
-    rows = db.execute(
-        """
-        SELECT t.* FROM tasks t
-        WHERE t.workflow_run_id = ?
-          AND t.status = 'pending'
-          AND NOT EXISTS (
-            SELECT 1 FROM task_dependencies td
-            JOIN tasks dt ON td.depends_on_task_id = dt.id
-            WHERE td.task_id = t.id AND dt.status != 'completed'
-          )
-        """,
-        (workflow_run_id,),
-    )
-    return [dict(row) for row in rows]
+    rows = db.execute(_RUNNABLE_TASKS_SQL, (workflow_run_id,))
+    return [TaskRow(*row) for row in rows]
 
 
 def save_task_context(task_id: str, context_xml: str, token_count: int) -> None:
@@ -265,8 +369,8 @@ def save_task_output(
             task_id,
             output_xml,
             summary,
-            json.dumps(key_decisions),
-            json.dumps(artifacts),
+            _dumps(key_decisions),
+            _dumps(artifacts),
             tokens_used,
             model_used,
         ),
@@ -284,9 +388,36 @@ def get_task_output(task_id: str) -> dict | None:
     """
     db = get_db()
     row = db.execute_one("SELECT * FROM task_outputs WHERE task_id = ?", (task_id,))
-    if row:
-        result = dict(row)
-        result["key_decisions"] = json.loads(result["key_decisions"] or "[]")
-        result["artifacts"] = json.loads(result["artifacts"] or "[]")
-        return result
-    return None
+    return _decode_output(dict(row)) if row else None
+
+
+def get_task_io(task_id: str) -> tuple[str | None, dict | None]:
+    """Get task context XML and output in a single query.
+
+    Args:
+        task_id: Task identifier
+
+    Returns:
+        Tuple of (context XML or None, output dictionary or None)
+    """
+    db = get_db()
+    row = db.execute_one(_TASK_IO_SQL, (task_id,))
+    result = dict(row)
+    context_xml = result.pop("context_xml")
+    if result["task_id"] is None:
+        return context_xml, None
+    return context_xml, _decode_output(result)
+
+
+def _decode_output(result: dict) -> dict:
+    """Parse the JSON fields of a task_outputs row in place.
+
+    Args:
+        result: task_outputs row as a dictionary
+
+    Returns:
+        The same dictionary with key_decisions and artifacts decoded
+    """
+    result["key_decisions"] = _loads(result["key_decisions"] or "[]")
+    result["artifacts"] = _loads(result["artifacts"] or "[]")
+    return result
@@ -1,10 +1,75 @@
 """Workflow storage operations."""
 
-import uuid
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 
 from agentic_builder.core.constants import StageStatus, WorkflowStatus
 from agentic_builder.storage.database import get_db
+from agentic_builder.storage.rows import RowMixin
+
+
+@dataclass(slots=True)
+class WorkflowRow(RowMixin):
+    """A row of the workflow_runs table."""
+
+    id: str
+    workflow_type: str
+    description: str | None
+    status: str
+    current_stage_id: str | None
+    total_tokens_used: int | None
+    estimated_cost_usd: float | None
+    error_message: str | None
+    started_at: str | None
+    completed_at: str | None
+    created_at: str | None
+    updated_at: str | None
+
+
+# Columns in WorkflowRow field order
+_WORKFLOW_COLUMNS = """
+    id, workflow_type, description, status, current_stage_id, total_tokens_used,
+    estimated_cost_usd, error_message, started_at, completed_at, created_at, updated_at
+"""
+
+_INSERT_WORKFLOW_SQL = """
+    INSERT INTO workflow_runs (id, workflow_type, description, status, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_INSERT_WORKFLOW_WITH_STATUS_SQL = """
+    INSERT INTO workflow_runs (id, workflow_type, description, status, created_at,
+                               started_at, completed_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_STAGE_SQL = """
+    INSERT INTO workflow_stages (id, workflow_run_id, stage_name, stage_order, parallel, status)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_GET_WORKFLOW_SQL = f"SELECT {_WORKFLOW_COLUMNS} FROM workflow_runs WHERE id = ?"
+_GET_STAGE_SQL = "SELECT * FROM workflow_stages WHERE id = ?"
+_LATEST_WORKFLOW_SQL = (
+    f"SELECT {_WORKFLOW_COLUMNS} FROM workflow_runs ORDER BY created_at DESC LIMIT 1"
+)
+_WORKFLOWS_SQL = (
+    f"SELECT {_WORKFLOW_COLUMNS} FROM workflow_runs ORDER BY created_at DESC LIMIT ?"
+)
+_WORKFLOWS_BY_STATUS_SQL = (
+    f"SELECT {_WORKFLOW_COLUMNS} FROM workflow_runs"
+    " WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+)
+
+
+def _now() -> datetime:
+    """Get the current UTC time for workflow timestamps.
+
+    Returns:
+        Naive datetime in UTC
+    """
+    return datetime.utcnow()
 
 
 def generate_workflow_id() -> str:
@@ -13,9 +78,9 @@ def generate_workflow_id() -> str:
     Returns:
         Workflow ID in format wf_YYYYMMDD_HHMMSS_XXXXXXXX
     """
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    short_uuid = uuid.uuid4().hex[:8]
-    return f"wf_{timestamp}_{short_uuid}"
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+    suffix = os.urandom(4).hex()
+    return f"wf_{timestamp}_{suffix}"
 
 
 def create_workflow(
@@ -33,44 +98,76 @@ def create_workflow(
     """
     db = get_db()
     workflow_id = generate_workflow_id()
+    # Same layout as CURRENT_TIMESTAMP, with microseconds to keep creation order
+    created_at = _now().isoformat(sep=" ")
     db.execute_write(
-        """
-        INSERT INTO workflow_runs (id, workflow_type, description, status)
-        VALUES (?, ?, ?, ?)
-        """,
-        (workflow_id, workflow_type, description, WorkflowStatus.PENDING.value),
+        _INSERT_WORKFLOW_SQL,
+        (workflow_id, workflow_type, description, WorkflowStatus.PENDING.value, created_at),
     )
     return workflow_id
 
 
-def get_workflow(workflow_id: str) -> dict | None:
+def create_workflows_bulk(
+    workflows: Iterable[tuple[str, str, WorkflowStatus]],
+) -> list[str]:
+    """Create several workflow runs in a single transaction.
+
+    Each workflow gets the timestamps update_workflow_status would set for
+    its initial status (started_at for RUNNING, completed_at for COMPLETED).
+
+    Args:
+        workflows: (workflow_type, description, initial status) tuples
+
+    Returns:
+        Generated workflow IDs, in input order
+    """
+    db = get_db()
+    rows = []
+    for workflow_type, description, status in workflows:
+        now = _now()
+        stamp = now.isoformat()
+        rows.append(
+            (
+                generate_workflow_id(),
+                workflow_type,
+                description,
+                status.value,
+                now.isoformat(sep=" "),
+                stamp if status == WorkflowStatus.RUNNING else None,
+                stamp if status == WorkflowStatus.COMPLETED else None,
+                stamp,
+            )
+        )
+    db.execute_many(_INSERT_WORKFLOW_WITH_STATUS_SQL, rows)
+    return [row[0] for row in rows]
+
+
+def get_workflow(workflow_id: str) -> WorkflowRow | None:
     """Get workflow by ID.
 
     Args:
         workflow_id: Workflow identifier
 
     Returns:
-        Workflow dictionary or None
+        WorkflowRow or None if not found
     """
     db = get_db()
-    row = db.execute_one("SELECT * FROM workflow_runs WHERE id = ?", (workflow_id,))
-    return dict(row) if row else None
+    row = db.execute_one(_GET_WORKFLOW_SQL, (workflow_id,))
+    return WorkflowRow(*row) if row else None
 
 
-def get_latest_workflow() -> dict | None:
+def get_latest_workflow() -> WorkflowRow | None:
     """Get the most recent workflow.
 
     Returns:
-        Most recent workflow dictionary or None
+        Most recent WorkflowRow or None
     """
     db = get_db()
-    row = db.execute_one(
-        "SELECT * FROM workflow_runs ORDER BY created_at DESC LIMIT 1"
-    )
-    return dict(row) if row else None
+    row = db.execute_one(_LATEST_WORKFLOW_SQL)
+    return WorkflowRow(*row) if row else None
 
 
-def get_workflows(status: str | None = None, limit: int = 20) -> list[dict]:
+def get_workflows(status: str | None = None, limit: int = 20) -> list[WorkflowRow]:
     """Get workflows with optional status filter.
 
     Args:
@@ -78,56 +175,49 @@ def get_workflows(status: str | None = None, limit: int = 20) -> list[dict]:
         limit: Maximum number of workflows to return
 
     Returns:
-        List of workflow dictionaries
+        List of WorkflowRow objects
     """
     db = get_db()
     if status:
-        rows = db.execute(
-            "SELECT * FROM workflow_runs WHERE status = ? ORDER BY created_at DESC LIMIT ?",
-            (status, limit),
-        )
+        rows = db.execute(_WORKFLOWS_BY_STATUS_SQL, (status, limit))
     else:
-        rows = db.execute(
-            "SELECT * FROM workflow_runs ORDER BY created_at DESC LIMIT ?",
-            (limit,),
-        )
-    return [dict(row) for row in rows]
+        rows = db.execute(_WORKFLOWS_SQL, (limit,))
+    return [WorkflowRow(*row) for row in rows]
 
 
 def update_workflow_status(
     workflow_id: str,
     status: WorkflowStatus,
     error_message: str | None = None,
-) -> None:
+) -> WorkflowRow | None:
     """Update workflow status.
 
     Args:
         workflow_id: Workflow identifier
         status: New workflow status
         error_message: Optional error message for failed workflows
+
+    Returns:
+        Updated WorkflowRow, or None if the workflow does not exist
     """
     db = get_db()
-    now = datetime.utcnow().isoformat()
+    now = _now().isoformat()
     if status == WorkflowStatus.RUNNING:
-        db.execute_write(
-            "UPDATE workflow_runs SET status = ?, started_at = ?, updated_at = ? WHERE id = ?",
-            (status.value, now, now, workflow_id),
-        )
+        query = "UPDATE workflow_runs SET status = ?, started_at = ?, updated_at = ? WHERE id = ?"
+        params = (status.value, now, now, workflow_id)
     elif status == WorkflowStatus.COMPLETED:
-        db.execute_write(
-            "UPDATE workflow_runs SET status = ?, completed_at = ?, updated_at = ? WHERE id = ?",
-            (status.value, now, now, workflow_id),
-        )
+        query = "UPDATE workflow_runs SET status = ?, completed_at = ?, updated_at = ? WHERE id = ?"
+        params = (status.value, now, now, workflow_id)
     elif error_message:
-        db.execute_write(
-            "UPDATE workflow_runs SET status = ?, error_message = ?, updated_at = ? WHERE id = ?",
-            (status.value, error_message, now, workflow_id),
-        )
+        query = "UPDATE workflow_runs SET status = ?, error_message = ?, updated_at = ? WHERE id = ?"
+        params = (status.value, error_message, now, workflow_id)
     else:
-        db.execute_write(
-            "UPDATE workflow_runs SET status = ?, updated_at = ? WHERE id = ?",
-            (status.value, now, workflow_id),
-        )
+        query = "UPDATE workflow_runs SET status = ?, updated_at = ? WHERE id = ?"
+        params = (status.value, now, workflow_id)
+    row = db.execute_returning(
+        query, params, _WORKFLOW_COLUMNS, _GET_WORKFLOW_SQL, (workflow_id,)
+    )
+    return WorkflowRow(*row) if row else None
 
 
 def add_tokens_to_workflow(workflow_id: str, tokens: int, cost: float) -> None:
@@ -142,15 +232,28 @@ def add_tokens_to_workflow(workflow_id: str, tokens: int, cost: float) -> None:
     db.execute_write(
         """
         UPDATE workflow_runs
-        SET total_tokens_used = total_tokens_used + ?,
-            estimated_cost_usd = estimated_cost_usd + ?,
+        SET total_tokens_used = COALESCE(total_tokens_used, 0) + ?,
+            estimated_cost_usd = COALESCE(estimated_cost_usd, 0) + ?,
             updated_at = ?
         WHERE id = ?
         """,
-        (tokens, cost, datetime.utcnow().isoformat(), workflow_id),
+        (tokens, cost, _now().isoformat(), workflow_id),
     )
 
 
+def _stage_id(workflow_run_id: str, stage_order: int) -> str:
+    """Build the ID of a workflow stage from its position.
+
+    Args:
+        workflow_run_id: Parent workflow ID
+        stage_order: Order in the workflow (0-indexed)
+
+    Returns:
+        Stage ID
+    """
+    return f"{workflow_run_id}_stage_{stage_order:02d}"
+
+
 def create_stage(
     workflow_run_id: str,
     stage_name: str,
@@ -169,12 +272,9 @@ def create_stage(
         Generated stage ID
     """
     db = get_db()
-    stage_id = f"{workflow_run_id}_stage_{stage_order:02d}"
+    stage_id = _stage_id(workflow_run_id, stage_order)
     db.execute_write(
-        """
-        INSERT INTO workflow_stages (id, workflow_run_id, stage_name, stage_order, parallel, status)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
+        _INSERT_STAGE_SQL,
         (
             stage_id,
             workflow_run_id,
@@ -187,6 +287,34 @@ def create_stage(
     return stage_id
 
 
+def create_stages_bulk(
+    workflow_run_id: str, stages: Iterable[tuple[str, int, bool]]
+) -> list[str]:
+    """Create several workflow stages in a single transaction.
+
+    Args:
+        workflow_run_id: Parent workflow ID
+        stages: (stage_name, stage_order, parallel) tuples
+
+    Returns:
+        Generated stage IDs, in input order
+    """
+    db = get_db()
+    rows = [
+        (
+            _stage_id(workflow_run_id, stage_order),
+            workflow_run_id,
+            stage_name,
+            stage_order,
+            int(parallel),
+            StageStatus.PENDING.value,
+        )
+        for stage_name, stage_order, parallel in stages
+    ]
+    db.execute_many(_INSERT_STAGE_SQL, rows)
+    return [row[0] for row in rows]
+
+
 def get_workflow_stages(workflow_run_id: str) -> list[dict]:
     """Get stages for a workflow.
 
@@ -214,34 +342,33 @@ def get_stage(stage_id: str) -> dict | None:
         Stage dictionary or None
     """
     db = get_db()
-    row = db.execute_one("SELECT * FROM workflow_stages WHERE id = ?", (stage_id,))
+    row = db.execute_one(_GET_STAGE_SQL, (stage_id,))
     return dict(row) if row else None
 
 
-def update_stage_status(stage_id: str, status: StageStatus) -> None:
+def update_stage_status(stage_id: str, status: StageStatus) -> dict | None:
     """Update stage status.
 
     Args:
         stage_id: Stage identifier
         status: New stage status
+
+    Returns:
+        Updated stage dictionary, or None if the stage does not exist
     """
     db = get_db()
-    now = datetime.utcnow().isoformat()
+    now = _now().isoformat()
     if status == StageStatus.RUNNING:
-        db.execute_write(
-            "UPDATE workflow_stages SET status = ?, started_at = ? WHERE id = ?",
-            (status.value, now, stage_id),
-        )
+        query = "UPDATE workflow_stages SET status = ?, started_at = ? WHERE id = ?"
+        params = (status.value, now, stage_id)
     elif status in (StageStatus.COMPLETED, StageStatus.FAILED, StageStatus.SKIPPED):
-        db.execute_write(
-            "UPDATE workflow_stages SET status = ?, completed_at = ? WHERE id = ?",
-            (status.value, now, stage_id),
-        )
+        query = "UPDATE workflow_stages SET status = ?, completed_at = ? WHERE id = ?"
+        params = (status.value, now, stage_id)
     else:
-        db.execute_write(
-            "UPDATE workflow_stages SET status = ? WHERE id = ?",
-            (status.value, stage_id),
-        )
+        query = "UPDATE workflow_stages SET status = ? WHERE id = ?"
+        params = (status.value, stage_id)
+    row = db.execute_returning(query, params, "*", _GET_STAGE_SQL, (stage_id,))
+    return dict(row) if row else None
 
 
 def get_next_pending_stage(workflow_run_id: str) -> dict | None:
@@ -1,26 +1,84 @@
 """Test configuration and fixtures."""
 
+import itertools
 import os
+import shutil
+import sqlite3
+import uuid
 from unittest.mock import patch
 
 import pytest
 
 
-
 @pytest.fixture
 def temp_db_path(tmp_path):
     """Create a temporary database path for testing."""
     return tmp_path / "test.db"
 
 
+@pytest.fixture(scope="session")
+def _template_db(tmp_path_factory):
+    """Run the schema DDL once into a template database file."""
+    from agentic_builder.storage.database import Database
+
+    path = tmp_path_factory.mktemp("template") / "template.db"
+    Database(path).initialize()
+    return path
+
+
+@pytest.fixture
+def fresh_db(temp_db_path, _template_db):
+    """Create an initialized database by copying the session template."""
+    from agentic_builder.storage.database import Database
+
+    shutil.copyfile(_template_db, temp_db_path)
+    return Database(temp_db_path)
+
+
+@pytest.fixture(scope="session")
+def _template_memory_db():
+    """Run the schema DDL once into a session-wide in-memory database."""
+    from agentic_builder.storage.schema import SCHEMA_DDL
+
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA_DDL)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def memory_db(_template_memory_db):
+    """Create an in-memory database by copying the session template.
+
+    Shared-cache URIs let every connection the Database opens see the same
+    data; the keeper connection holds the database alive for the test.
+    """
+    from agentic_builder.storage.database import Database
+
+    uri = f"file:agentic_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)
+    _template_memory_db.backup(keeper)
+    yield Database(uri)
+    keeper.close()
+
+
 @pytest.fixture(autouse=True)
-def isolate_database(temp_db_path, request):
-    """Isolate database for each test by using a temporary database."""
+def isolate_database(request):
+    """Isolate database for each test by using a temporary database.
+
+    Tests that request ``fresh_db`` get that file-backed database; all others
+    run against an in-memory copy of the schema.
+    """
     # Skip database isolation for path-specific tests
     if request.cls and request.cls.__name__ == 'TestDatabasePath':
         yield
         return
 
+    if "fresh_db" in request.fixturenames:
+        db = request.getfixturevalue("fresh_db")
+    else:
+        db = request.getfixturevalue("memory_db")
+
     # Clear the global database instance
     from agentic_builder.storage import database
     database._db = None
@@ -29,15 +87,34 @@ def isolate_database(temp_db_path, request):
     original_init = database.Database.__init__
 
     def patched_init(self, db_path=None):
-        return original_init(self, temp_db_path)
+        return original_init(self, db.db_path)
 
     with patch.object(database.Database, '__init__', patched_init):
-        # Create and initialize the database
-        db = database.Database()
-        db.initialize()
         # Set the global database instance
         database._db = db
         yield db
+
+
+@pytest.fixture
+def workflow_id():
+    """Create a workflow in the isolated database and return its ID."""
+    from agentic_builder.storage import workflows as workflow_storage
+
+    return workflow_storage.create_workflow("test_type", "test description")
+
+
+@pytest.fixture
+def fast_clock(monkeypatch):
+    """Make workflow timestamps advance one second per call, without waiting."""
+    from datetime import datetime, timedelta
+
+    from agentic_builder.storage import workflows
+
+    start = datetime(2024, 11, 24, 12, 0, 0)
+    ticks = itertools.count()
+    monkeypatch.setattr(workflows, "_now", lambda: start + timedelta(seconds=next(ticks)))
+
+
 @pytest.fixture
 def mock_project_dir(tmp_path):
     """Mock the project directory for testing."""
@@ -63,6 +140,30 @@ def mock_env():
         yield env_vars
 
 
+@pytest.fixture(scope="session")
+def prompt_files():
+    """Names of all files in the prompts directory, from a single scandir."""
+    from agentic_builder.core.config import get_prompts_dir
+
+    with os.scandir(get_prompts_dir()) as entries:
+        return {entry.name for entry in entries if entry.is_file()}
+
+
+@pytest.fixture(scope="session")
+def unknown_agent():
+    """Stand-in for an agent type missing from the registry."""
+    return object()
+
+
+@pytest.fixture(scope="session")
+def agent_prompts():
+    """Prompt text for every agent type, loaded once per session."""
+    from agentic_builder.agents.prompt_loader import load_prompt
+    from agentic_builder.core.constants import AgentType
+
+    return {agent_type: load_prompt(agent_type) for agent_type in AgentType}
+
+
 @pytest.fixture
 def sample_workflow_data():
     """Sample workflow data for testing."""
@@ -128,4 +229,7 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "database: marks tests that require database access"
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run grouped tests on the same pytest-xdist worker"
     )
\ No newline at end of file
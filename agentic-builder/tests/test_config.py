@@ -52,13 +52,13 @@ class TestPaths:
 
     def test_get_project_dir(self):
         """Test project directory path."""
-        with patch("pathlib.Path.cwd", return_value=Path("/test/project")):
+        with patch("os.getcwd", return_value="/test/project"):
             project_dir = get_project_dir()
             assert project_dir == Path("/test/project/.agentic")
 
     def test_get_db_path(self):
         """Test database path."""
-        with patch("pathlib.Path.cwd", return_value=Path("/test/project")):
+        with patch("os.getcwd", return_value="/test/project"):
             db_path = get_db_path()
             assert db_path == Path("/test/project/.agentic/agentic.db")
 
@@ -67,6 +67,7 @@ class TestPaths:
         # This should point to the prompts directory in the package
         prompts_dir = get_prompts_dir()
         # The path should contain "prompts" and "agents"
-        assert "prompts" in str(prompts_dir)
-        assert "agents" in str(prompts_dir)
+        parts = prompts_dir.parts
+        assert "prompts" in parts
+        assert "agents" in parts
         assert prompts_dir.exists()  # Should exist in the actual project
\ No newline at end of file
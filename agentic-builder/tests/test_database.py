@@ -7,7 +7,14 @@ from unittest.mock import patch
 
 import pytest
 
-from agentic_builder.storage.database import Database, get_db
+from agentic_builder.storage import database
+from agentic_builder.storage.database import BUSY_TIMEOUT_MS, Database, get_db
+
+EXPECTED_TABLES = frozenset({
+    "workflow_runs", "workflow_stages", "tasks", "task_dependencies",
+    "task_context", "task_outputs", "agent_instances", "artifacts",
+    "token_usage", "config",
+})
 
 
 class TestDatabase:
@@ -22,143 +29,176 @@ class TestDatabase:
 
         with db.connection() as conn:
             cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-
-            expected_tables = [
-                'workflow_runs', 'workflow_stages', 'tasks', 'task_dependencies',
-                'task_context', 'task_outputs', 'agent_instances', 'artifacts',
-                'token_usage', 'config'
-            ]
-
-            for table in expected_tables:
-                assert table in tables, f"Table {table} not created"
-
-            # Check that tables were created
-            with db.connection() as conn:
-                cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = [row[0] for row in cursor.fetchall()]
-
-                expected_tables = [
-                    'workflow_runs', 'workflow_stages', 'tasks', 'task_dependencies',
-                    'task_context', 'task_outputs', 'agent_instances', 'artifacts',
-                    'token_usage', 'config'
-                ]
+            tables = {row[0] for row in cursor.fetchall()}
 
-                for table in expected_tables:
-                    assert table in tables, f"Table {table} not created"
+        missing = EXPECTED_TABLES - tables
+        assert not missing, f"Missing tables: {sorted(missing)}"
 
-    def test_connection_context_manager(self):
+    def test_connection_context_manager(self, fresh_db):
         """Test database connection context manager."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = Database(db_path)
-            db.initialize()
+        db = fresh_db
 
-            # Test successful operation
-            with db.connection() as conn:
-                conn.execute("INSERT INTO config (key, value) VALUES (?, ?)", ("test_key", "test_value"))
-                # Should commit automatically
-
-            # Verify the insert worked
-            with db.connection() as conn:
-                cursor = conn.execute("SELECT value FROM config WHERE key = ?", ("test_key",))
-                row = cursor.fetchone()
-                assert row[0] == "test_value"
+        # Test successful operation, verified on the same connection
+        with db.connection() as conn:
+            conn.execute("INSERT INTO config (key, value) VALUES (?, ?)", ("test_key", "test_value"))
+            row = conn.execute("SELECT value FROM config WHERE key = ?", ("test_key",)).fetchone()
+            assert row[0] == "test_value"
+            # Should commit automatically on exit
 
-    def test_connection_rollback_on_error(self):
+    def test_connection_rollback_on_error(self, fresh_db):
         """Test that connection rolls back on exceptions."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = Database(db_path)
-            db.initialize()
+        db = fresh_db
+
+        # Test rollback on exception
+        with pytest.raises(RuntimeError, match="Test exception"), db.connection() as conn:
+            conn.execute("INSERT INTO config (key, value) VALUES (?, ?)", ("rollback_test", "value"))
+            # The insert is pending in this connection's transaction
+            assert conn.total_changes == 1
+            raise RuntimeError("Test exception")
 
-            # Get initial count
-            with db.connection() as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM config")
-                initial_count = cursor.fetchone()[0]
-
-            # Test rollback on exception
-            try:
-                with db.connection() as conn:
-                    conn.execute("INSERT INTO config (key, value) VALUES (?, ?)", ("rollback_test", "value"))
-                    raise Exception("Test exception")
-            except Exception:
-                pass  # Expected
-
-            # Verify rollback worked - count should be unchanged
-            with db.connection() as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM config")
-                final_count = cursor.fetchone()[0]
-                assert final_count == initial_count
-
-    def test_execute_query(self):
+        # Verify rollback worked - a primary key probe, no table scan
+        with db.connection() as conn:
+            row = conn.execute("SELECT 1 FROM config WHERE key = ?", ("rollback_test",)).fetchone()
+            assert row is None
+
+    def test_execute_query(self, fresh_db):
         """Test basic query execution."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = Database(db_path)
-            db.initialize()
+        db = fresh_db
 
-            # Insert test data
-            db.execute_write("INSERT INTO config (key, value) VALUES (?, ?)", ("test_key", "test_value"))
+        # Insert test data
+        db.execute_write("INSERT INTO config (key, value) VALUES (?, ?)", ("test_key", "test_value"))
 
-            # Query data
-            rows = db.execute("SELECT * FROM config WHERE key = ?", ("test_key",))
-            assert len(rows) == 1
-            assert rows[0]["key"] == "test_key"
-            assert rows[0]["value"] == "test_value"
+        # Query data
+        rows = db.execute("SELECT * FROM config WHERE key = ?", ("test_key",))
+        assert len(rows) == 1
+        assert rows[0]["key"] == "test_key"
+        assert rows[0]["value"] == "test_value"
 
-    def test_execute_one_query(self):
+    def test_execute_one_query(self, fresh_db):
         """Test single row query execution."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = Database(db_path)
-            db.initialize()
+        db = fresh_db
 
-            # Insert test data
-            db.execute_write("INSERT INTO config (key, value) VALUES (?, ?)", ("single_key", "single_value"))
+        # Insert test data
+        db.execute_write("INSERT INTO config (key, value) VALUES (?, ?)", ("single_key", "single_value"))
 
-            # Query single row
-            row = db.execute_one("SELECT * FROM config WHERE key = ?", ("single_key",))
-            assert row is not None
-            assert row["key"] == "single_key"
-            assert row["value"] == "single_value"
+        # Query single row
+        row = db.execute_one("SELECT * FROM config WHERE key = ?", ("single_key",))
+        assert row is not None
+        assert row["key"] == "single_key"
+        assert row["value"] == "single_value"
 
-            # Query non-existent row
-            row = db.execute_one("SELECT * FROM config WHERE key = ?", ("nonexistent",))
-            assert row is None
+        # Query non-existent row
+        row = db.execute_one("SELECT * FROM config WHERE key = ?", ("nonexistent",))
+        assert row is None
 
-    def test_execute_write(self):
+    def test_execute_write(self, fresh_db):
         """Test write query execution."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = Database(db_path)
-            db.initialize()
+        db = fresh_db
 
+        with db.connection() as conn:
             # Insert data
-            affected = db.execute_write("INSERT INTO config (key, value) VALUES (?, ?)", ("write_key", "write_value"))
-            assert affected == 1
+            cursor = conn.execute("INSERT INTO config (key, value) VALUES (?, ?)", ("write_key", "write_value"))
+            assert cursor.rowcount == 1
 
             # Update data
-            affected = db.execute_write("UPDATE config SET value = ? WHERE key = ?", ("updated_value", "write_key"))
-            assert affected == 1
+            cursor = conn.execute("UPDATE config SET value = ? WHERE key = ?", ("updated_value", "write_key"))
+            assert cursor.rowcount == 1
 
             # Delete data
-            affected = db.execute_write("DELETE FROM config WHERE key = ?", ("write_key",))
-            assert affected == 1
+            cursor = conn.execute("DELETE FROM config WHERE key = ?", ("write_key",))
+            assert cursor.rowcount == 1
+
+        # execute_write reports the rows affected by its own transaction
+        assert db.execute_write(
+            "INSERT INTO config (key, value) VALUES (?, ?)", ("write_key", "write_value")
+        ) == 1
+
+    @pytest.mark.parametrize("supports_returning", [True, False])
+    def test_execute_returning(self, fresh_db, monkeypatch, supports_returning):
+        """Test reading back a written row with and without RETURNING."""
+        monkeypatch.setattr(database, "SUPPORTS_RETURNING", supports_returning)
+        db = fresh_db
+        db.execute_write("INSERT INTO config (key, value) VALUES (?, ?)", ("ret_key", "old"))
+
+        def update(key):
+            return db.execute_returning(
+                "UPDATE config SET value = ? WHERE key = ?",
+                ("new", key),
+                "key, value",
+                "SELECT key, value FROM config WHERE key = ?",
+                (key,),
+            )
+
+        assert tuple(update("ret_key")) == ("ret_key", "new")
+        assert update("missing_key") is None
+
+    def test_execute_many(self, fresh_db):
+        """Test batched write execution in a single transaction."""
+        db = fresh_db
+
+        rows = [(f"bulk_key_{i}", f"value_{i}") for i in range(1000)]
+        affected = db.execute_many("INSERT INTO config (key, value) VALUES (?, ?)", rows)
+        assert affected == 1000
+
+        row = db.execute_one("SELECT COUNT(*) FROM config WHERE key LIKE 'bulk_key_%'")
+        assert row[0] == 1000
+
+    def test_wal_mode_enabled(self, fresh_db):
+        """Test that connections use WAL journaling and a busy timeout."""
+        db = fresh_db
 
-    def test_foreign_key_constraints(self):
-        """Test that foreign key constraints are enforced."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            db_path = Path(temp_dir) / "test.db"
-            db = Database(db_path)
-            db.initialize()
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # NORMAL == 1
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == BUSY_TIMEOUT_MS
 
-            # Try to insert task with non-existent workflow
-            with pytest.raises(sqlite3.IntegrityError):
-                db.execute_write(
-                    "INSERT INTO tasks (id, workflow_run_id, title, agent_type, status) VALUES (?, ?, ?, ?, ?)",
-                    ("task1", "nonexistent_workflow", "Test Task", "PM", "pending")
-                )
+    def test_shared_memory_uri(self, memory_db):
+        """Test that a shared in-memory database persists across connections."""
+        db = memory_db
+
+        db.execute_write("INSERT INTO config (key, value) VALUES (?, ?)", ("memory_key", "memory_value"))
+
+        row = db.execute_one("SELECT value FROM config WHERE key = ?", ("memory_key",))
+        assert row["value"] == "memory_value"
+
+    def test_isolated_database_is_in_memory(self):
+        """Test that tests without fresh_db run against an in-memory journal."""
+        with get_db().connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "memory"
+
+    def test_initialize_drops_superseded_indexes(self, tmp_path):
+        """Test that initializing an existing database drops replaced indexes."""
+        db = Database(tmp_path / "existing.db")
+        db.initialize()
+        with db.connection() as conn:
+            conn.execute("CREATE INDEX idx_tasks_workflow ON tasks(workflow_run_id)")
+            conn.execute(
+                "CREATE INDEX idx_workflow_stages_run ON workflow_stages(workflow_run_id)"
+            )
+
+        db.initialize()
+
+        with db.connection() as conn:
+            indexes = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+        assert "idx_tasks_workflow" not in indexes
+        assert "idx_tasks_workflow_status" in indexes
+        assert "idx_workflow_stages_run" not in indexes
+        assert "idx_workflow_stages_run_order" in indexes
+
+    def test_foreign_key_constraints(self, fresh_db):
+        """Test that foreign key constraints are enforced."""
+        db = fresh_db
+
+        # Try to insert task with non-existent workflow
+        with pytest.raises(sqlite3.IntegrityError):
+            db.execute_write(
+                "INSERT INTO tasks (id, workflow_run_id, title, agent_type, status) VALUES (?, ?, ?, ?, ?)",
+                ("task1", "nonexistent_workflow", "Test Task", "PM", "pending")
+            )
 
 
 class TestGlobalDatabase:
@@ -1,10 +1,12 @@
 """Tests for agent prompt loading."""
 
+import re
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from agentic_builder.agents import prompt_loader
 from agentic_builder.agents.prompt_loader import (
     clear_cache,
     get_prompt_path,
@@ -12,6 +14,16 @@ from agentic_builder.agents.prompt_loader import (
 )
 from agentic_builder.core.constants import AgentType
 
+# Output skeleton every agent prompt must describe, in order
+_TASK_OUTPUT_RE = re.compile(r"<task_output>.*?<success>.*?<summary>", re.DOTALL)
+
+
+@pytest.fixture
+def preloaded_prompts(agent_prompts, monkeypatch):
+    """Install the session's prompts as a warm loader cache for one test."""
+    monkeypatch.setattr(prompt_loader, "_prompt_cache", dict(agent_prompts))
+    return agent_prompts
+
 
 class TestLoadPrompt:
     """Test prompt loading functionality."""
@@ -19,11 +31,10 @@ class TestLoadPrompt:
     def test_load_existing_prompt(self):
         """Test loading an existing agent prompt."""
         prompt = load_prompt(AgentType.PM)
-        assert isinstance(prompt, str)
-        assert len(prompt) > 0
         # Should contain some expected content
         assert "Product Manager" in prompt or "product manager" in prompt.lower()
 
+    @pytest.mark.xdist_group("prompt_cache")
     def test_load_prompt_caching(self):
         """Test that prompts are cached after first load."""
         # Clear cache first
@@ -38,21 +49,13 @@ class TestLoadPrompt:
         assert prompt1 == prompt2
         assert prompt1 is prompt2  # Same object reference
 
-    def test_load_unknown_agent_type(self):
+    def test_load_unknown_agent_type(self, unknown_agent):
         """Test loading prompt for unknown agent type."""
-        # Create a mock agent type that doesn't exist
-        class MockAgentType:
-            pass
-
         with pytest.raises(ValueError, match="Unknown agent type"):
-            load_prompt(MockAgentType())  # type: ignore
+            load_prompt(unknown_agent)  # type: ignore
 
-    def test_load_prompt_file_not_found(self):
+    def test_load_prompt_file_not_found(self, unknown_agent):
         """Test loading prompt when file doesn't exist."""
-        # Create a mock agent type with non-existent prompt file
-        class MockAgentType:
-            pass
-
         # Mock the registry to return a config with non-existent file
         mock_config = type('MockConfig', (), {
             'prompt_file': 'nonexistent.md'
@@ -60,7 +63,7 @@ class TestLoadPrompt:
 
         with patch('agentic_builder.agents.prompt_loader.get_agent_config', return_value=mock_config):
             with pytest.raises(FileNotFoundError, match="Prompt file not found"):
-                load_prompt(MockAgentType())  # type: ignore
+                load_prompt(unknown_agent)  # type: ignore
 
 
 class TestGetPromptPath:
@@ -74,23 +77,20 @@ class TestGetPromptPath:
         assert path.exists()
         assert path.name == "product-manager.md"
 
-    def test_get_prompt_path_unknown_agent(self):
+    def test_get_prompt_path_unknown_agent(self, unknown_agent):
         """Test getting prompt path for unknown agent."""
-        # Create a mock agent type
-        class MockAgentType:
-            pass
-
-        path = get_prompt_path(MockAgentType())  # type: ignore
+        path = get_prompt_path(unknown_agent)  # type: ignore
         assert path is None
 
-    def test_get_prompt_path_all_agents(self):
+    def test_get_prompt_path_all_agents(self, prompt_files):
         """Test that all agent types have valid prompt paths."""
         for agent_type in AgentType:
             path = get_prompt_path(agent_type)
             assert path is not None, f"No prompt path for {agent_type}"
-            assert path.exists(), f"Prompt file does not exist: {path}"
+            assert path.name in prompt_files, f"Prompt file does not exist: {path}"
 
 
+@pytest.mark.xdist_group("prompt_cache")
 class TestCacheManagement:
     """Test prompt cache management."""
 
@@ -110,11 +110,15 @@ class TestCacheManagement:
         # Note: In this implementation, the cache uses object identity,
         # so after clearing, it should be a different object
 
-    def test_cache_isolation(self):
+    def test_cache_isolation(self, preloaded_prompts):
         """Test that cache is isolated between different agent types."""
         prompt_pm = load_prompt(AgentType.PM)
         prompt_arch = load_prompt(AgentType.ARCH)
 
+        # Both come straight from the warm cache
+        assert prompt_pm is preloaded_prompts[AgentType.PM]
+        assert prompt_arch is preloaded_prompts[AgentType.ARCH]
+
         assert prompt_pm != prompt_arch
         assert "Product Manager" in prompt_pm or "product manager" in prompt_pm.lower()
         assert "Architect" in prompt_arch or "architect" in prompt_arch.lower()
@@ -123,14 +127,12 @@ class TestCacheManagement:
 class TestPromptContent:
     """Test prompt content validation."""
 
-    def test_prompt_contains_expected_sections(self):
+    @pytest.mark.parametrize("agent_type", list(AgentType))
+    def test_prompt_contains_expected_sections(self, agent_prompts, agent_type):
         """Test that prompts contain expected XML structure."""
-        prompt = load_prompt(AgentType.PM)
-
-        # Most prompts should contain task_output structure
-        assert "<task_output>" in prompt
-        assert "<success>" in prompt
-        assert "<summary>" in prompt
+        assert _TASK_OUTPUT_RE.search(agent_prompts[agent_type]), (
+            f"{agent_type} prompt lacks <task_output>/<success>/<summary> structure"
+        )
 
     def test_prompt_file_encoding(self):
         """Test that prompt files are properly encoded."""
@@ -142,15 +144,15 @@ class TestPromptContent:
         assert isinstance(content, str)
         assert len(content) > 0
 
-    def test_all_prompt_files_readable(self):
+    def test_all_prompt_files_readable(self, prompt_files):
         """Test that all prompt files are readable."""
         for agent_type in AgentType:
             path = get_prompt_path(agent_type)
             assert path is not None
+            assert path.name in prompt_files
 
             try:
-                content = path.read_text(encoding='utf-8')
-                assert isinstance(content, str)
+                content = path.read_bytes()
                 assert len(content) > 0
             except Exception as e:
                 pytest.fail(f"Failed to read prompt file for {agent_type}: {e}")
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Tests for agent registry."""
 
+from dataclasses import fields
+from operator import attrgetter
 
 from agentic_builder.agents.registry import (
     AGENT_CONFIGS,
@@ -10,6 +12,20 @@ from agentic_builder.agents.registry import (
 )
 from agentic_builder.core.constants import AgentType, ModelTier
 
+# Invariants shared across tests, computed once at import
+_CONFIGS = tuple(AGENT_CONFIGS.values())
+_TYPES = tuple(AgentType)
+
+# Expected type of every AgentConfig field
+_VALIDATORS = (
+    ("type", AgentType),
+    ("name", str),
+    ("description", str),
+    ("prompt_file", str),
+    ("model_tier", ModelTier),
+    ("capabilities", list),
+)
+
 
 class TestAgentConfig:
     """Test AgentConfig dataclass."""
@@ -44,13 +60,9 @@ class TestAgentRegistry:
         assert config.name == "Product Manager"
         assert config.model_tier == ModelTier.SONNET
 
-    def test_get_agent_config_nonexistent(self):
+    def test_get_agent_config_nonexistent(self, unknown_agent):
         """Test getting config for nonexistent agent type."""
-        # Create a mock agent type that doesn't exist
-        class MockAgentType:
-            pass
-
-        config = get_agent_config(MockAgentType())  # type: ignore
+        config = get_agent_config(unknown_agent)  # type: ignore
         assert config is None
 
     def test_get_all_agents(self):
@@ -67,20 +79,18 @@ class TestAgentRegistry:
         pm_configs = [a for a in agents if a.type == AgentType.PM]
         assert len(pm_configs) == 1
 
+        # Every known agent type is registered
+        assert set(map(attrgetter("type"), agents)) == set(_TYPES)
+
     def test_all_agent_configs_have_required_fields(self):
         """Test that all agent configs have required fields."""
-        for agent_type, config in AGENT_CONFIGS.items():
-            assert isinstance(config.type, AgentType)
-            assert isinstance(config.name, str)
-            assert len(config.name) > 0
-            assert isinstance(config.description, str)
-            assert len(config.description) > 0
-            assert isinstance(config.prompt_file, str)
-            assert len(config.prompt_file) > 0
-            assert config.prompt_file.endswith(".md")
-            assert isinstance(config.model_tier, ModelTier)
-            assert isinstance(config.capabilities, list)
-            assert len(config.capabilities) > 0
+        assert {attr for attr, _ in _VALIDATORS} == {f.name for f in fields(AgentConfig)}
+        for config in _CONFIGS:
+            for attr, typ in _VALIDATORS:
+                assert isinstance(getattr(config, attr), typ), f"{config.type}.{attr}"
+            assert all(
+                (config.name, config.description, config.capabilities, config.prompt_file.endswith(".md"))
+            ), f"Incomplete config for {config.type}"
 
     def test_get_model_for_agent(self):
         """Test getting model tier for agent types."""
@@ -100,25 +110,17 @@ class TestAgentRegistry:
         model = get_model_for_agent(AgentType.TQR)
         assert model == ModelTier.HAIKU
 
-    def test_get_model_for_unknown_agent(self):
+    def test_get_model_for_unknown_agent(self, unknown_agent):
         """Test getting model for unknown agent type (should default to sonnet)."""
-        # Create a mock agent type
-        class MockAgentType:
-            pass
-
-        model = get_model_for_agent(MockAgentType())  # type: ignore
+        model = get_model_for_agent(unknown_agent)  # type: ignore
         assert model == ModelTier.SONNET  # Default fallback
 
     def test_agent_config_uniqueness(self):
         """Test that each agent type has a unique configuration."""
-        types = [config.type for config in AGENT_CONFIGS.values()]
+        types = list(map(attrgetter("type"), _CONFIGS))
         assert len(types) == len(set(types))  # No duplicates
 
-    def test_prompt_files_exist(self):
+    def test_prompt_files_exist(self, prompt_files):
         """Test that all referenced prompt files exist."""
-        from agentic_builder.core.config import get_prompts_dir
-
-        prompts_dir = get_prompts_dir()
-        for config in AGENT_CONFIGS.values():
-            prompt_path = prompts_dir / config.prompt_file
-            assert prompt_path.exists(), f"Prompt file {config.prompt_file} does not exist"
\ No newline at end of file
+        for config in _CONFIGS:
+            assert config.prompt_file in prompt_files, f"Prompt file {config.prompt_file} does not exist"
\ No newline at end of file
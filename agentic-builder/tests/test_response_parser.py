@@ -1,6 +1,8 @@
 """Tests for agent response parsing."""
 
+import xml.etree.ElementTree as ET
 
+from agentic_builder.agents import response_parser
 from agentic_builder.agents.response_parser import (
     AgentResponse,
     extract_list_items,
@@ -30,6 +32,12 @@ class TestExtractTagContent:
         result = extract_tag_content(xml, "artifact")
         assert result == 'print("hello")'
 
+    def test_extract_ignores_longer_tag_names(self):
+        """Test that a tag name does not match tags it is a prefix of."""
+        xml = "<task_output><task>Inner</task></task_output>"
+        result = extract_tag_content(xml, "task")
+        assert result == "Inner"
+
     def test_extract_nonexistent_tag(self):
         """Test extracting from nonexistent tag."""
         xml = "<summary>Content</summary>"
@@ -153,6 +161,8 @@ class TestParseResponse:
 
         assert response.success is False
         assert "no task_output found" in response.summary
+        assert response.raw_xml == xml
+        assert response.artifacts == []
 
     def test_parse_malformed_xml(self):
         """Test parsing malformed XML."""
@@ -175,9 +185,122 @@ class TestParseResponse:
         assert response.success is True
         assert response.summary == "Summary with <tags> & special chars"
 
+    def test_parse_cdata_in_non_wellformed_content(self):
+        """Test that CDATA is unwrapped when falling back to tag matching."""
+        xml = """<task_output>
+        <success>true</success>
+        <summary><![CDATA[Summary with <tags> & special chars]]></summary>
+        <warnings><warning>a < b</warning></warnings>
+        </task_output>"""
+
+        response = parse_response(xml)
+
+        assert response.summary == "Summary with <tags> & special chars"
+        assert response.warnings == ["a < b"]
+
+    def test_parse_non_wellformed_content(self):
+        """Test parsing output whose content is not valid XML."""
+        xml = """<task_output>
+        <success>true</success>
+        <summary>Code with operators</summary>
+        <artifacts>
+        <artifact type="code" name="cond.py">
+        <content>if a < b && c:
+    pass</content>
+        </artifact>
+        </artifacts>
+        </task_output>"""
+
+        response = parse_response(xml)
+
+        assert response.success is True
+        assert response.summary == "Code with operators"
+        assert response.artifacts[0]["content"] == "if a < b && c:\n    pass"
+
+    def test_parse_nested_markup_in_content(self):
+        """Test that markup nested in content is preserved."""
+        xml = """<task_output>
+        <success>true</success>
+        <summary>Template</summary>
+        <artifacts>
+        <artifact type="code" name="index.html">
+        <content><div class="app">Hello</div></content>
+        </artifact>
+        </artifacts>
+        </task_output>"""
+
+        response = parse_response(xml)
+
+        assert response.artifacts[0]["content"] == '<div class="app">Hello</div>'
+
+    def test_parse_commented_out_artifact(self):
+        """Test that a commented-out artifact does not shift the real one."""
+        xml = """<task_output>
+        <success>true</success>
+        <summary>Rewrite</summary>
+        <artifacts><!-- <artifact type="code" name="old.py">old</artifact> -->
+        <artifact type="code" name="new.py"><content>NEW</content></artifact>
+        </artifacts>
+        </task_output>"""
+
+        response = parse_response(xml)
+
+        assert [(a["name"], a["content"]) for a in response.artifacts] == [("new.py", "NEW")]
+
+    def test_parse_commented_out_task(self):
+        """Test that a commented-out next task is ignored."""
+        xml = """<task_output>
+        <success>true</success>
+        <summary>Plan</summary>
+        <next_tasks>
+        <!-- <task agent="QA" priority="low"><title>Old</title></task> -->
+        <task agent="DEV_PYTHON" priority="high"><title>New</title></task>
+        </next_tasks>
+        </task_output>"""
+
+        response = parse_response(xml)
+
+        assert [(t["agent_type"], t["title"]) for t in response.next_tasks] == [
+            ("DEV_PYTHON", "New")
+        ]
+
+    def test_parse_markup_in_content_verbatim(self, monkeypatch):
+        """Test that well-formed content is returned as written without lxml."""
+        monkeypatch.setattr(response_parser, "etree", ET)
+        monkeypatch.setattr(response_parser, "_XML_PARSER", None)
+        svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg"><!-- logo -->'
+            "<circle r='1'/><br/></svg>"
+        )
+        xml = f"""<task_output>
+            <success>true</success>
+            <summary>S &amp; T</summary>
+            <artifacts>
+                <artifact type="code" name="logo.svg">
+                    <description>Logo &amp; icon</description>
+                    <content>{svg}</content>
+                </artifact>
+            </artifacts>
+            <key_decisions><decision>Use <b>SVG</b></decision></key_decisions>
+        </task_output>"""
+
+        response = parse_response(xml)
+
+        assert response.success is True
+        assert response.summary == "S &amp; T"
+        assert response.artifacts == [
+            {
+                "type": "code",
+                "name": "logo.svg",
+                "description": "Logo &amp; icon",
+                "content": svg,
+            }
+        ]
+        assert response.key_decisions == ["Use <b>SVG</b>"]
+
 
 class TestAgentResponse:
-    """Test AgentResponse dataclass."""
+    """Test AgentResponse."""
 
     def test_agent_response_creation(self):
         """Test creating an AgentResponse instance."""
@@ -209,4 +332,15 @@ class TestAgentResponse:
         assert response.artifacts == []
         assert response.next_tasks == []
         assert response.warnings == []
-        assert response.raw_xml == ""
\ No newline at end of file
+        assert response.raw_xml == ""
+
+    def test_agent_response_equality(self):
+        """Test that responses with the same fields compare equal."""
+        assert AgentResponse(True, "Done") == AgentResponse(True, "Done")
+        assert AgentResponse(True, "Done") != AgentResponse(False, "Done")
+
+    def test_agent_response_has_no_instance_dict(self):
+        """Test that AgentResponse stores its fields in slots."""
+        response = AgentResponse(success=True, summary="Done")
+
+        assert not hasattr(response, "__dict__")
@@ -0,0 +1,44 @@
+"""Tests for storage row records."""
+
+from dataclasses import dataclass
+
+import pytest
+from agentic_builder.storage.rows import RowMixin
+from agentic_builder.storage.workflows import WorkflowRow
+
+
+@dataclass(slots=True)
+class _Row(RowMixin):
+    id: str
+    note: str | None
+
+    def __post_init__(self) -> None:
+        pass
+
+
+class TestRowMixin:
+    """Test dict-style column access on row records."""
+
+    def test_column_access(self):
+        """Test reading columns by key."""
+        row = _Row("row_1", None)
+
+        assert row["id"] == row.id == "row_1"
+        assert row.get("note", "fallback") is None
+        assert row.get("no_such_column", "fallback") == "fallback"
+
+    @pytest.mark.parametrize("key", ["no_such_column", "get", "__post_init__", "__slots__"])
+    def test_non_columns_raise_key_error(self, key):
+        """Test that methods and other attributes are not columns."""
+        row = _Row("row_1", None)
+
+        with pytest.raises(KeyError):
+            row[key]
+        assert row.get(key) is None
+
+    def test_rows_have_no_instance_dict(self):
+        """Test that the mixin keeps row dataclasses slotted."""
+        workflow = WorkflowRow("wf_1", "type", None, "pending", *[None] * 8)
+
+        assert not hasattr(workflow, "__dict__")
+        assert workflow["status"] == "pending"
@@ -1,7 +1,6 @@
 """Tests for task storage operations."""
 
-
-
+import pytest
 from agentic_builder.core.constants import TaskStatus
 from agentic_builder.storage import tasks as task_storage
 from agentic_builder.storage import workflows as workflow_storage
@@ -10,10 +9,8 @@ from agentic_builder.storage import workflows as workflow_storage
 class TestTaskCreation:
     """Test task creation operations."""
 
-    def test_create_task(self):
+    def test_create_task(self, workflow_id):
         """Test creating a new task."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
-
         task_id = "test_task_001"
         title = "Test Task"
         agent_type = "PM"
@@ -44,10 +41,9 @@ class TestTaskCreation:
         assert task["created_by"] == created_by
         assert task["status"] == TaskStatus.PENDING.value
 
-    def test_get_task(self):
+    def test_get_task(self, workflow_id):
         """Test retrieving a task."""
         # Create a task first
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         task_id = "get_test_task"
         task_storage.create_task(
             task_id=task_id,
@@ -65,26 +61,53 @@ class TestTaskCreation:
         nonexistent = task_storage.get_task("nonexistent_task")
         assert nonexistent is None
 
+    def test_task_row_access(self, workflow_id):
+        """Test that task rows support dict-style column access."""
+        task_storage.create_task(
+            task_id="row_task",
+            workflow_run_id=workflow_id,
+            title="Row Task",
+            agent_type="PM",
+        )
+
+        task = task_storage.get_task("row_task")
+        assert task.title == task["title"] == "Row Task"
+        assert task.get("stage_id", "fallback") is None
+        assert task.get("no_such_column", "fallback") == "fallback"
+        with pytest.raises(KeyError):
+            task["no_such_column"]
+
+    def test_task_row_interns_enum_columns(self, workflow_id):
+        """Test that repeated status and agent type values share one string."""
+        task_storage.create_tasks_bulk(
+            {"task_id": f"intern_{i}", "workflow_run_id": workflow_id,
+             "title": f"Task {i}", "agent_type": "PM"}
+            for i in range(2)
+        )
+
+        first, second = task_storage.get_workflow_tasks(workflow_id)
+        assert first.status is second.status
+        assert first.agent_type is second.agent_type
+
 
 class TestTaskQueries:
     """Test task query operations."""
 
-    def test_get_workflow_tasks(self):
+    def test_get_workflow_tasks(self, workflow_id):
         """Test getting tasks for a workflow."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
-
         # Create multiple tasks
-        task_ids = []
-        for i in range(3):
-            task_id = f"query_task_{i}"
-            task_storage.create_task(
-                task_id=task_id,
-                workflow_run_id=workflow_id,
-                title=f"Task {i}",
-                agent_type="PM",
-                priority="medium" if i % 2 == 0 else "high",
-            )
-            task_ids.append(task_id)
+        task_ids = [f"query_task_{i}" for i in range(3)]
+        created = task_storage.create_tasks_bulk(
+            {
+                "task_id": task_id,
+                "workflow_run_id": workflow_id,
+                "title": f"Task {i}",
+                "agent_type": "PM",
+                "priority": "medium" if i % 2 == 0 else "high",
+            }
+            for i, task_id in enumerate(task_ids)
+        )
+        assert created == 3
 
         # Get all tasks for workflow
         tasks = task_storage.get_workflow_tasks(workflow_id)
@@ -101,23 +124,30 @@ class TestTaskQueries:
         pending_tasks = task_storage.get_workflow_tasks(workflow_id, status=TaskStatus.PENDING.value)
         assert len(pending_tasks) == 2
 
-    def test_get_stage_tasks(self):
+        # Several statuses in one query
+        task_storage.update_task_status(task_ids[1], TaskStatus.RUNNING)
+        active_tasks = task_storage.get_workflow_tasks(
+            workflow_id, status=(TaskStatus.PENDING.value, TaskStatus.RUNNING.value)
+        )
+        assert {task["id"] for task in active_tasks} == set(task_ids[1:])
+        assert task_storage.get_workflow_tasks(workflow_id, status=()) == []
+
+    def test_get_stage_tasks(self, workflow_id):
         """Test getting tasks for a stage."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         stage_id = workflow_storage.create_stage(workflow_id, "test_stage", 0)
 
         # Create tasks for the stage
-        task_ids = []
-        for i in range(2):
-            task_id = f"stage_task_{i}"
-            task_storage.create_task(
-                task_id=task_id,
-                workflow_run_id=workflow_id,
-                stage_id=stage_id,
-                title=f"Stage Task {i}",
-                agent_type="PM",
-            )
-            task_ids.append(task_id)
+        task_ids = [f"stage_task_{i}" for i in range(2)]
+        task_storage.create_tasks_bulk(
+            {
+                "task_id": task_id,
+                "workflow_run_id": workflow_id,
+                "stage_id": stage_id,
+                "title": f"Stage Task {i}",
+                "agent_type": "PM",
+            }
+            for i, task_id in enumerate(task_ids)
+        )
 
         # Get tasks for stage
         stage_tasks = task_storage.get_stage_tasks(stage_id)
@@ -135,9 +165,8 @@ class TestTaskQueries:
 class TestTaskStatusUpdates:
     """Test task status update operations."""
 
-    def test_update_task_status_basic(self):
+    def test_update_task_status_basic(self, workflow_id):
         """Test basic task status updates."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         task_id = "status_test_task"
         task_storage.create_task(
             task_id=task_id,
@@ -168,9 +197,8 @@ class TestTaskStatusUpdates:
 class TestTaskDependencies:
     """Test task dependency operations."""
 
-    def test_add_task_dependency(self):
+    def test_add_task_dependency(self, workflow_id):
         """Test adding task dependencies."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         task_id = "dependent_task"
         depends_on_id = "dependency_task"
 
@@ -195,9 +223,8 @@ class TestTaskDependencies:
         dependencies = task_storage.get_task_dependencies(task_id)
         assert depends_on_id in dependencies
 
-    def test_get_task_dependencies(self):
+    def test_get_task_dependencies(self, workflow_id):
         """Test retrieving task dependencies."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         task_id = "multi_dep_task"
 
         # Create task
@@ -209,17 +236,18 @@ class TestTaskDependencies:
         )
 
         # Create multiple dependencies
-        dep_ids = []
-        for i in range(3):
-            dep_id = f"dep_{i}"
-            task_storage.create_task(
-                task_id=dep_id,
-                workflow_run_id=workflow_id,
-                title=f"Dependency {i}",
-                agent_type="PM",
-            )
+        dep_ids = [f"dep_{i}" for i in range(3)]
+        task_storage.create_tasks_bulk(
+            {
+                "task_id": dep_id,
+                "workflow_run_id": workflow_id,
+                "title": f"Dependency {i}",
+                "agent_type": "PM",
+            }
+            for i, dep_id in enumerate(dep_ids)
+        )
+        for dep_id in dep_ids:
             task_storage.add_task_dependency(task_id, dep_id)
-            dep_ids.append(dep_id)
 
         # Get dependencies
         dependencies = task_storage.get_task_dependencies(task_id)
@@ -227,10 +255,8 @@ class TestTaskDependencies:
         for dep_id in dep_ids:
             assert dep_id in dependencies
 
-    def test_get_runnable_tasks(self):
+    def test_get_runnable_tasks(self, workflow_id):
         """Test getting tasks that are ready to run."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
-
         # Create tasks with dependencies
         task1_id = "runnable_task1"
         task2_id = "runnable_task2"
@@ -289,9 +315,8 @@ class TestTaskDependencies:
 class TestTaskContext:
     """Test task context operations."""
 
-    def test_save_and_get_task_context(self):
+    def test_save_and_get_task_context(self, workflow_id):
         """Test saving and retrieving task context."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         task_id = "context_task"
         context_xml = '<context><summary>Test context</summary></context>'
         token_count = 150
@@ -320,9 +345,8 @@ class TestTaskContext:
 class TestTaskOutput:
     """Test task output operations."""
 
-    def test_save_and_get_task_output(self):
+    def test_save_and_get_task_output(self, workflow_id):
         """Test saving and retrieving task output."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         task_id = "output_task"
         output_xml = '<output><success>true</success><summary>Task completed</summary></output>'
         summary = "Task completed successfully"
@@ -368,9 +392,35 @@ class TestTaskOutput:
         nonexistent_output = task_storage.get_task_output("nonexistent_task")
         assert nonexistent_output is None
 
-    def test_task_output_json_serialization(self):
+    def test_get_task_io(self, workflow_id):
+        """Test fetching context and output together."""
+        task_id = "io_task"
+        task_storage.create_task(
+            task_id=task_id,
+            workflow_run_id=workflow_id,
+            title="IO Task",
+            agent_type="PM",
+        )
+        assert task_storage.get_task_io(task_id) == (None, None)
+
+        task_storage.save_task_context(task_id, "<context/>", 10)
+        assert task_storage.get_task_io(task_id) == ("<context/>", None)
+
+        task_storage.save_task_output(
+            task_id=task_id,
+            output_xml="<task_output/>",
+            summary="Done",
+            key_decisions=["Decision 1"],
+            artifacts=[],
+            tokens_used=100,
+            model_used="sonnet",
+        )
+        context, output = task_storage.get_task_io(task_id)
+        assert context == "<context/>"
+        assert output == task_storage.get_task_output(task_id)
+
+    def test_task_output_json_serialization(self, workflow_id):
         """Test that JSON fields are properly serialized/deserialized."""
-        workflow_id = workflow_storage.create_workflow("test_type", "test description")
         task_id = "json_task"
 
         # Create task
@@ -1,8 +1,22 @@
 """Tests for workflow storage operations."""
 
+import re
 
+import pytest
 from agentic_builder.core.constants import StageStatus, WorkflowStatus
 from agentic_builder.storage import workflows as workflow_storage
+from agentic_builder.storage.database import get_db
+
+# wf_YYYYMMDD_HHMMSS_ followed by 8 random hex characters
+_WF_ID_RE = re.compile(r"wf_\d{8}_\d{6}_[0-9a-f]{8}")
+
+# Status strings as stored in the database
+_WF_COMPLETED = WorkflowStatus.COMPLETED.value
+_WF_PENDING = WorkflowStatus.PENDING.value
+_WF_RUNNING = WorkflowStatus.RUNNING.value
+_STAGE_COMPLETED = StageStatus.COMPLETED.value
+_STAGE_PENDING = StageStatus.PENDING.value
+_STAGE_RUNNING = StageStatus.RUNNING.value
 
 
 class TestWorkflowCreation:
@@ -12,15 +26,7 @@ class TestWorkflowCreation:
         """Test workflow ID generation."""
         workflow_id = workflow_storage.generate_workflow_id()
 
-        # Should start with wf_
-        assert workflow_id.startswith("wf_")
-
-        # Should contain timestamp and UUID parts
-        parts = workflow_id.split("_")
-        assert len(parts) == 4  # wf, date, time, uuid
-        assert len(parts[1]) == 8  # YYYYMMDD
-        assert len(parts[2]) == 6  # HHMMSS
-        assert len(parts[3]) == 8  # Short UUID
+        assert _WF_ID_RE.fullmatch(workflow_id), workflow_id
 
     def test_create_workflow(self):
         """Test creating a new workflow."""
@@ -35,7 +41,7 @@ class TestWorkflowCreation:
         assert workflow["id"] == workflow_id
         assert workflow["workflow_type"] == workflow_type
         assert workflow["description"] == description
-        assert workflow["status"] == WorkflowStatus.PENDING.value
+        assert workflow["status"] == _WF_PENDING
 
     def test_get_workflow(self):
         """Test retrieving a workflow."""
@@ -51,88 +57,76 @@ class TestWorkflowCreation:
         nonexistent = workflow_storage.get_workflow("nonexistent_id")
         assert nonexistent is None
 
-    def test_get_latest_workflow(self):
+    def test_get_latest_workflow(self, fast_clock):
         """Test getting the most recent workflow."""
-        # Create multiple workflows with a small delay to ensure different timestamps
         id1 = workflow_storage.create_workflow("type1", "desc1")
-        import time
-        time.sleep(0.01)  # Small delay to ensure different timestamps
         id2 = workflow_storage.create_workflow("type2", "desc2")
+        assert id1 != id2
 
-        # Latest should be one of the workflows we just created
+        # The clock ticks between the two, so the second is the latest
         latest = workflow_storage.get_latest_workflow()
         assert latest is not None
-        assert latest["id"] in [id1, id2]  # Should be one of the created workflows
+        assert latest["id"] == id2
+        assert latest["workflow_type"] == "type2"
+        assert latest["description"] == "desc2"
 
-        # And it should have the correct type and description
-        if latest["id"] == id1:
-            assert latest["workflow_type"] == "type1"
-            assert latest["description"] == "desc1"
-        elif latest["id"] == id2:
-            assert latest["workflow_type"] == "type2"
-            assert latest["description"] == "desc2"
+    def test_update_missing_workflow_status(self):
+        """Test updating a workflow that does not exist."""
+        assert workflow_storage.update_workflow_status("nonexistent_id", WorkflowStatus.RUNNING) is None
 
     def test_get_workflows(self):
         """Test getting workflows with filters."""
-        # Create test workflows
-        id1 = workflow_storage.create_workflow("running", "desc1")
-        id2 = workflow_storage.create_workflow("completed", "desc2")
-        id3 = workflow_storage.create_workflow("running", "desc3")
-
-        # Update statuses
-        workflow_storage.update_workflow_status(id1, WorkflowStatus.RUNNING)
-        workflow_storage.update_workflow_status(id2, WorkflowStatus.COMPLETED)
-        workflow_storage.update_workflow_status(id3, WorkflowStatus.RUNNING)
+        # Create test workflows with their statuses in one batch
+        ids = workflow_storage.create_workflows_bulk([
+            ("running", "desc1", WorkflowStatus.RUNNING),
+            ("completed", "desc2", WorkflowStatus.COMPLETED),
+            ("running", "desc3", WorkflowStatus.RUNNING),
+        ])
+        assert len(set(ids)) == 3
+        assert workflow_storage.get_workflow(ids[1])["description"] == "desc2"
+        # Initial statuses carry the timestamps a status update would set
+        assert workflow_storage.get_workflow(ids[0])["started_at"] is not None
+        assert workflow_storage.get_workflow(ids[1])["completed_at"] is not None
 
         # Get all workflows
         all_workflows = workflow_storage.get_workflows()
         assert len(all_workflows) >= 3
 
         # Get running workflows
-        running_workflows = workflow_storage.get_workflows(status=WorkflowStatus.RUNNING.value)
+        running_workflows = workflow_storage.get_workflows(status=_WF_RUNNING)
         assert len(running_workflows) >= 2
-        for wf in running_workflows:
-            assert wf["status"] == WorkflowStatus.RUNNING.value
+        assert all(wf["status"] == _WF_RUNNING for wf in running_workflows)
 
         # Get completed workflows
-        completed_workflows = workflow_storage.get_workflows(status=WorkflowStatus.COMPLETED.value)
+        completed_workflows = workflow_storage.get_workflows(status=_WF_COMPLETED)
         assert len(completed_workflows) >= 1
-        for wf in completed_workflows:
-            assert wf["status"] == WorkflowStatus.COMPLETED.value
-
-    def test_update_workflow_status(self):
-        """Test updating workflow status."""
-        workflow_id = workflow_storage.create_workflow("test", "desc")
-
-        # Update to running
-        workflow_storage.update_workflow_status(workflow_id, WorkflowStatus.RUNNING)
-        workflow = workflow_storage.get_workflow(workflow_id)
-        assert workflow["status"] == WorkflowStatus.RUNNING.value
-        assert workflow["started_at"] is not None
-
-        # Update to completed
-        workflow_storage.update_workflow_status(workflow_id, WorkflowStatus.COMPLETED)
-        workflow = workflow_storage.get_workflow(workflow_id)
-        assert workflow["status"] == WorkflowStatus.COMPLETED.value
-        assert workflow["completed_at"] is not None
-
-        # Update with error
-        error_msg = "Test error"
-        workflow_storage.update_workflow_status(
-            workflow_id, WorkflowStatus.FAILED, error_message=error_msg
+        assert all(wf["status"] == _WF_COMPLETED for wf in completed_workflows)
+
+    @pytest.mark.parametrize(
+        ("status", "field", "error_message"),
+        [
+            (WorkflowStatus.RUNNING, "started_at", None),
+            (WorkflowStatus.COMPLETED, "completed_at", None),
+            (WorkflowStatus.FAILED, "error_message", "Test error"),
+        ],
+    )
+    def test_update_workflow_status(self, workflow_id, status, field, error_message):
+        """Test updating workflow status sets the field for that transition."""
+        workflow = workflow_storage.update_workflow_status(
+            workflow_id, status, error_message=error_message
         )
-        workflow = workflow_storage.get_workflow(workflow_id)
-        assert workflow["status"] == WorkflowStatus.FAILED.value
-        assert workflow["error_message"] == error_msg
+
+        assert workflow["status"] == status.value
+        assert workflow[field] is not None
+        if error_message:
+            assert workflow["error_message"] == error_message
 
 
 class TestStageOperations:
     """Test workflow stage operations."""
 
-    def test_create_stage(self):
+    def test_create_stage(self, workflow_id):
         """Test creating a workflow stage."""
-        workflow_id = workflow_storage.create_workflow("test", "desc")
-
         stage_name = "Requirements Gathering"
         stage_order = 0
         parallel = False
@@ -152,26 +146,19 @@ class TestStageOperations:
         assert stage["stage_name"] == stage_name
         assert stage["stage_order"] == stage_order
         assert stage["parallel"] == parallel
-        assert stage["status"] == StageStatus.PENDING.value
+        assert stage["status"] == _STAGE_PENDING
 
-    def test_get_workflow_stages(self):
+    def test_get_workflow_stages(self, workflow_id):
         """Test getting stages for a workflow."""
-        workflow_id = workflow_storage.create_workflow("test", "desc")
-
-        # Create multiple stages
-        stage_ids = []
-        for i in range(3):
-            stage_id = workflow_storage.create_stage(
-                workflow_run_id=workflow_id,
-                stage_name=f"Stage {i}",
-                stage_order=i,
-                parallel=(i == 1),  # Make stage 1 parallel
-            )
-            stage_ids.append(stage_id)
+        # Create multiple stages; stage 1 is parallel
+        stage_ids = workflow_storage.create_stages_bulk(
+            workflow_id, [(f"Stage {i}", i, i == 1) for i in range(3)]
+        )
 
         # Get stages
         stages = workflow_storage.get_workflow_stages(workflow_id)
         assert len(stages) == 3
+        assert [stage["id"] for stage in stages] == stage_ids
 
         # Should be ordered by stage_order
         for i, stage in enumerate(stages):
@@ -179,9 +166,8 @@ class TestStageOperations:
             assert stage["stage_name"] == f"Stage {i}"
             assert stage["parallel"] == (i == 1)
 
-    def test_update_stage_status(self):
+    def test_update_stage_status(self, workflow_id):
         """Test updating stage status."""
-        workflow_id = workflow_storage.create_workflow("test", "desc")
         stage_id = workflow_storage.create_stage(
             workflow_run_id=workflow_id,
             stage_name="Test Stage",
@@ -189,21 +175,17 @@ class TestStageOperations:
         )
 
         # Update to running
-        workflow_storage.update_stage_status(stage_id, StageStatus.RUNNING)
-        stage = workflow_storage.get_stage(stage_id)
-        assert stage["status"] == StageStatus.RUNNING.value
+        stage = workflow_storage.update_stage_status(stage_id, StageStatus.RUNNING)
+        assert stage["status"] == _STAGE_RUNNING
         assert stage["started_at"] is not None
 
         # Update to completed
-        workflow_storage.update_stage_status(stage_id, StageStatus.COMPLETED)
-        stage = workflow_storage.get_stage(stage_id)
-        assert stage["status"] == StageStatus.COMPLETED.value
+        stage = workflow_storage.update_stage_status(stage_id, StageStatus.COMPLETED)
+        assert stage["status"] == _STAGE_COMPLETED
         assert stage["completed_at"] is not None
 
-    def test_get_next_pending_stage(self):
+    def test_get_next_pending_stage(self, workflow_id):
         """Test getting the next pending stage."""
-        workflow_id = workflow_storage.create_workflow("test", "desc")
-
         # Create stages
         stage1_id = workflow_storage.create_stage(
             workflow_run_id=workflow_id, stage_name="Stage 1", stage_order=0
@@ -236,10 +218,8 @@ class TestStageOperations:
 class TestTokenTracking:
     """Test token usage tracking in workflows."""
 
-    def test_add_tokens_to_workflow(self):
+    def test_add_tokens_to_workflow(self, workflow_id):
         """Test adding token usage to workflow totals."""
-        workflow_id = workflow_storage.create_workflow("test", "desc")
-
         # Add some token usage
         workflow_storage.add_tokens_to_workflow(workflow_id, tokens=1000, cost=5.50)
 
@@ -254,4 +234,17 @@ class TestTokenTracking:
         # Check totals accumulated
         workflow = workflow_storage.get_workflow(workflow_id)
         assert workflow["total_tokens_used"] == 1500
-        assert workflow["estimated_cost_usd"] == 8.25
\ No newline at end of file
+        assert workflow["estimated_cost_usd"] == 8.25
+
+    def test_add_tokens_to_workflow_with_null_totals(self, workflow_id):
+        """Test that token usage accumulates onto NULL totals."""
+        get_db().execute_write(
+            "UPDATE workflow_runs SET total_tokens_used = NULL, estimated_cost_usd = NULL WHERE id = ?",
+            (workflow_id,),
+        )
+
+        workflow_storage.add_tokens_to_workflow(workflow_id, tokens=1000, cost=5.50)
+
+        workflow = workflow_storage.get_workflow(workflow_id)
+        assert workflow["total_tokens_used"] == 1000
+        assert workflow["estimated_cost_usd"] == 5.50